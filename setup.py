@@ -5,9 +5,12 @@ setup(
     packages=find_packages(),
     install_requires=[
         "litellm",
+        "aiohttp",
         "crawl4ai",
         "mistralai",
         "htmldate",
+        "httpx[http2]",
+        "orjson",
         "requests",
         "pandas",
         "pydantic",
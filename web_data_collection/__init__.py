@@ -3,15 +3,22 @@ from .data_extraction import (
     extract_data,
     extract_data_streaming,
     generate_extraction_schema,
+    generate_extraction_schema_async,
 )
-from .quality_control import control_quality
+from .quality_control import control_quality, control_quality_async
 from .query_generation import generate_search_queries
 from .webpage_retrieval import (
+    RerankHit,
+    SerpResult,
     get_geolocation_countries,
     get_media_cloud_countries,
     get_url_date,
+    get_url_dates,
+    get_url_dates_async,
     rerank_results_jina_api,
+    rerank_results_jina_api_stream,
     retrieve_webpages,
+    retrieve_webpages_async,
     retrieve_webpages_streaming,
 )
 
@@ -22,13 +29,21 @@ __all__ = [
     "JinaConfig",
     "generate_search_queries",
     "retrieve_webpages",
+    "retrieve_webpages_async",
     "retrieve_webpages_streaming",
+    "SerpResult",
+    "RerankHit",
     "rerank_results_jina_api",
+    "rerank_results_jina_api_stream",
     "get_geolocation_countries",
     "get_media_cloud_countries",
     "get_url_date",
+    "get_url_dates",
+    "get_url_dates_async",
     "generate_extraction_schema",
+    "generate_extraction_schema_async",
     "extract_data",
     "extract_data_streaming",
     "control_quality",
+    "control_quality_async",
 ]
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Any, Optional
 
 
 class LLMConfig:
@@ -11,6 +11,7 @@ class LLMConfig:
         model: str = "openai/gpt-4.1",
         api_key: Optional[str] = None,
         temperature: Optional[float] = 0.2,
+        cache: bool = False,
     ):
         """
         Initialize LLM configuration.
@@ -19,10 +20,13 @@ class LLMConfig:
             model: The LLM model to use (e.g., "openai/gpt-4.1")
             api_key: API key for the LLM provider
             temperature: Sampling temperature
+            cache: Whether to cache LLM responses on disk and reuse them
+                for identical (model, temperature, prompt) calls
         """
         self.model = model
         self.api_key = api_key
         self.temperature = temperature
+        self.cache = cache
 
 
 class BrightDataConfig:
@@ -75,6 +79,10 @@ class JinaConfig:
         api_key: str,
         model: str = "jina-reranker-v2-base-multilingual",
         base_url: str = "https://api.jina.ai/v1/rerank",
+        max_workers: int = 8,
+        multi_query: bool = False,
+        client: Optional[Any] = None,
+        singleton_score: float = 1.0,
     ):
         """
         Initialize Jina configuration.
@@ -83,7 +91,18 @@ class JinaConfig:
             api_key: Jina API key
             model: Jina model to use
             base_url: Jina base URL
+            max_workers: Maximum number of concurrent rerank requests
+            multi_query: Whether the endpoint accepts batched multi-query
+                payloads; per-query calls are used as a fallback
+            client: Optional httpx.Client to use instead of the shared one
+            singleton_score: Score assigned to a document whose query
+                group contains only that document, which is ranked
+                locally without an API call
         """
         self.model = model
         self.api_key = api_key
         self.base_url = base_url
+        self.max_workers = max_workers
+        self.multi_query = multi_query
+        self.client = client
+        self.singleton_score = singleton_score
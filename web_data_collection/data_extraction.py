@@ -1,18 +1,123 @@
-import json
+import asyncio
+import contextlib
+import logging
 import re
-import urllib.parse
-from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple, Type
 
+import orjson
 from crawl4ai import AsyncWebCrawler, BrowserConfig, CacheMode, CrawlerRunConfig
 from crawl4ai import LLMConfig as Crawl4aiLLMConfig
 from crawl4ai.extraction_strategy import LLMExtractionStrategy
 from litellm import completion
 from mistralai import Mistral
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
 
 from .configs import LLMConfig, MistralOCRConfig
 from .prompts import GENERATE_EXTRACTION_SCHEMA_PROMPT
-from .utils import perform_completion
+from .utils import aperform_completion, perform_completion
+
+logger = logging.getLogger(__name__)
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Single alternation covering all markdown link/image forms handled by
+# _remove_markdown_links: images, empty links, inline links, reference
+# links and reference definitions. Fusing them lets the text be scanned
+# once instead of once per pattern.
+_LINK_RE = re.compile(
+    r"(?P<image>!\[[^\]]*\]\([^)]+\))"
+    r"|(?P<empty>\[\]\([^)]+\))"
+    r"|(?P<inline>\[(?P<inline_text>[^\]]+)\]\([^)]+\))"
+    r"|(?P<ref>\[(?P<ref_text>[^\]]+)\]\[[^\]]+\])"
+    r"|(?P<ref_def>^\[[^\]]+\]:\s*.*$)",
+    re.MULTILINE,
+)
+
+
+def _strip_link_markup(match: "re.Match") -> str:
+    """Replacement callback keeping link text and dropping everything else."""
+    return match.group("inline_text") or match.group("ref_text") or ""
+
+
+# Matches the class definition line of an extraction schema
+_CLASS_NAME_RE = re.compile(r"^\s*class\s+(\w+)\s*\(", re.MULTILINE)
+
+# Grounding quote field appended to every extraction schema
+_GROUNDING_FIELD_SRC = '\n    grounding_quote: str = Field(..., description="Short span of text taken verbatim from the webpage from which the data is extracted (just a few words), EXACTLY as it appears in the text, DO NOT miss any words in the middle. DO NOT include \\\\ before apostrophes or other special characters.")'
+
+
+@lru_cache(maxsize=32)
+def _build_schema_class(schema_src: str) -> Tuple[Type[BaseModel], Dict[str, Any]]:
+    """
+    Compile a schema source string into a Pydantic model class.
+
+    Cached on the schema source so repeated extract calls with the same
+    schema skip re-parsing, re-building the class and re-generating its
+    JSON schema.
+
+    Args:
+        schema_src: Python source defining a single Pydantic model class
+
+    Returns:
+        Tuple containing:
+            - The compiled Pydantic model class
+            - The model's JSON schema
+    """
+    namespace = {
+        "BaseModel": BaseModel,
+        "Field": Field,
+        "Optional": Optional,
+        "List": List,
+    }
+    match = _CLASS_NAME_RE.search(schema_src)
+    if match is None:
+        raise ValueError("No class definition found in schema")
+    code = compile(schema_src, "<extraction_schema>", "exec")
+    exec(code, namespace)
+    schema_class = namespace[match.group(1)]
+    return schema_class, schema_class.model_json_schema()
+
+
+# Matches runs of characters to drop when normalizing text for grounding
+# checks. \W is Unicode-aware so letters and digits in any script survive,
+# matching the previous isalnum() behavior; underscore is dropped explicitly
+# since \w keeps it.
+_NON_ALNUM_RE = re.compile(r"[\W_]+")
+
+# Matches URLs whose path ends in .pdf (optionally followed by a query
+# string or fragment), rather than any URL merely containing ".pdf"
+_PDF_RE = re.compile(r"\.pdf(?:$|[?#])", re.IGNORECASE)
+
+# Characters that need no percent-encoding in a URL text fragment, and the
+# precomputed encodings for every byte value
+_FRAGMENT_SAFE = frozenset(
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_.~"
+)
+_PCT_ENCODED = [f"%{i:02X}" for i in range(256)]
+
+
+def _quote_text_fragment(text: str) -> str:
+    """
+    Percent-encode text for use in a #:~:text= URL fragment.
+
+    Args:
+        text: The text to encode
+
+    Returns:
+        str: The percent-encoded text
+    """
+    if all(c in _FRAGMENT_SAFE for c in text):
+        return text
+    return "".join(
+        c
+        if c in _FRAGMENT_SAFE
+        else "".join(_PCT_ENCODED[b] for b in c.encode("utf-8"))
+        for c in text
+    )
 
 
 def generate_extraction_schema(
@@ -39,6 +144,50 @@ def generate_extraction_schema(
     return content
 
 
+async def generate_extraction_schema_async(
+    dataset_description: str, schema_fields: List[str], llm_config: LLMConfig
+) -> str:
+    """
+    Generate a schema representing the fields to extract from a webpage.
+
+    Async variant of generate_extraction_schema for callers already
+    running inside an event loop.
+
+    Args:
+        dataset_description: Description of the dataset we are collecting
+        schema_fields: List of fields to extract from the webpage
+        llm_config: Configuration for the LLM provider
+
+    Returns:
+        str: A string representing the schema
+    """
+    prompt = GENERATE_EXTRACTION_SCHEMA_PROMPT.format(
+        dataset_description=dataset_description,
+        schema_fields=schema_fields,
+    )
+    response = await aperform_completion(prompt, llm_config)
+    content = response.choices[0].message.content
+
+    return content
+
+
+@lru_cache(maxsize=4)
+def _mistral_client(api_key: str) -> Mistral:
+    """
+    Get a shared Mistral client for an API key.
+
+    Reusing the client keeps its HTTP session (and TLS handshake) alive
+    across PDF extractions instead of rebuilding it per call.
+
+    Args:
+        api_key: Mistral API key
+
+    Returns:
+        Mistral: The shared client
+    """
+    return Mistral(api_key=api_key)
+
+
 def _extract_pdf_text(url: str, mistral_ocr_config: MistralOCRConfig) -> str:
     """
     Extract the text from a PDF url.
@@ -50,7 +199,7 @@ def _extract_pdf_text(url: str, mistral_ocr_config: MistralOCRConfig) -> str:
     Returns:
         str: The extracted text from the PDF
     """
-    client = Mistral(api_key=mistral_ocr_config.api_key)
+    client = _mistral_client(mistral_ocr_config.api_key)
     ocr_response = client.ocr.process(
         model="mistral-ocr-latest",
         document={"type": "document_url", "document_url": url},
@@ -70,52 +219,153 @@ def _remove_markdown_links(text: str) -> str:
     Returns:
         str: The markdown-formatted string with links and images removed
     """
-    # Remove inline links [text](url)
-    text = re.sub(r"\[([^\]]+)\]\([^)]+\)", r"\1", text)
-    # Remove reference links [text][ref] and [ref]: url
-    text = re.sub(r"\[([^\]]+)\]\[[^\]]+\]", r"\1", text)
-    text = re.sub(r"^\[[^\]]+\]:\s*.*$", "", text, flags=re.MULTILINE)
-    # Remove images ![alt text](url)
-    text = re.sub(r"!\[[^\]]*\]\([^)]+\)", "", text)
-    # Remove empty links []()
-    text = re.sub(r"\[\]\([^)]+\)", "", text)
-    return text
+    return _LINK_RE.sub(_strip_link_markup, text)
 
 
-def _check_grounding(
-    datapoint: Dict[str, Any], webpage_markdown: str
-) -> Tuple[bool, str]:
+def _normalize_markdown(webpage_markdown: str) -> str:
     """
-    Check if the datapoint's grounding quote is present in the webpage markdown.
+    Normalize webpage markdown for grounding checks.
 
     Args:
-        datapoint: The datapoint to check grounding for. Must contain a "grounding_quote" field.
         webpage_markdown: The markdown-formatted string of the webpage
 
     Returns:
-        bool: True if the datapoint's grounding quote is present in the webpage markdown, False otherwise
-        str: The webpage markdown with the grounding quote removed
+        str: The markdown with links removed and non-alphanumeric characters stripped
     """
-    grounding = datapoint.get("grounding_quote")
-    if not grounding:
-        return False, None
-    grounding = "".join(c for c in grounding if c.isalnum())
-    webpage_markdown = "".join(
-        c for c in _remove_markdown_links(webpage_markdown) if c.isalnum()
-    )
-    return grounding in webpage_markdown, webpage_markdown
+    return _NON_ALNUM_RE.sub("", _remove_markdown_links(webpage_markdown))
 
 
-async def extract_data(
+def _check_groundings(
+    datapoints: List[Dict[str, Any]], webpage_markdown: str
+) -> List[bool]:
+    """
+    Check which datapoints' grounding quotes are present in the webpage markdown.
+
+    Quotes found verbatim in the raw markdown (the common case for
+    well-formed extractions) are accepted without normalizing the page.
+    Empty or trivially short quotes are rejected outright. Only the
+    remaining quotes trigger normalization of the full markdown; with
+    pyahocorasick installed they are then matched in a single pass
+    instead of one substring search per datapoint.
+
+    Args:
+        datapoints: The datapoints to check grounding for. Each should contain a "grounding_quote" field.
+        webpage_markdown: The markdown-formatted string of the webpage
+
+    Returns:
+        List[bool]: For each datapoint, True if its grounding quote is present in the webpage markdown
+    """
+    grounded = [False] * len(datapoints)
+    # Identical pending quotes share one entry mapped to all their indices
+    pending: Dict[str, List[int]] = {}
+
+    for i, datapoint in enumerate(datapoints):
+        quote = datapoint.get("grounding_quote")
+        if not quote:
+            continue
+        if quote in webpage_markdown:
+            grounded[i] = True
+            continue
+        normalized_quote = _NON_ALNUM_RE.sub("", quote)
+        if len(normalized_quote) < 4:
+            continue
+        pending.setdefault(normalized_quote, []).append(i)
+
+    if not pending:
+        return grounded
+
+    normalized_markdown = _normalize_markdown(webpage_markdown)
+    if ahocorasick is None or len(pending) < 2:
+        for quote, indices in pending.items():
+            if quote in normalized_markdown:
+                for i in indices:
+                    grounded[i] = True
+    else:
+        automaton = ahocorasick.Automaton()
+        for quote, indices in pending.items():
+            automaton.add_word(quote, indices)
+        automaton.make_automaton()
+        for _end, indices in automaton.iter(normalized_markdown):
+            for i in indices:
+                grounded[i] = True
+    return grounded
+
+
+async def _process_url(
+    url: str,
+    crawler: AsyncWebCrawler,
+    run_config: CrawlerRunConfig,
+    semaphore: asyncio.Semaphore,
+    schema_class: Type[BaseModel],
+    handle_pdfs: bool,
+    mistral_ocr_config: Optional[MistralOCRConfig],
+) -> List[Dict[str, Any]]:
+    """
+    Crawl a single URL and return its extracted datapoints.
+
+    Args:
+        url: The URL to extract data from
+        crawler: The crawler to use for extraction
+        run_config: Configuration for the crawler run
+        semaphore: Semaphore bounding the number of concurrent crawls
+        schema_class: Pydantic model used to validate extracted datapoints
+        handle_pdfs: Whether to handle PDFs
+        mistral_ocr_config: Configuration for the Mistral OCR API
+
+    Returns:
+        List[Dict[str, Any]]: List of datapoints extracted from the URL
+    """
+    async with semaphore:
+        if _PDF_RE.search(url):
+            if not handle_pdfs:
+                return []
+            pdf_text = await asyncio.to_thread(_extract_pdf_text, url, mistral_ocr_config)
+            to_extract = f"raw:{pdf_text}"
+        else:
+            to_extract = url
+
+        result = await crawler.arun(url=to_extract, config=run_config)
+
+    datapoints = []
+    if result and result.extracted_content:
+        try:
+            data = orjson.loads(result.extracted_content)
+        except orjson.JSONDecodeError:
+            return datapoints
+        for raw in data:
+            if raw.get("error"):
+                continue
+            try:
+                datapoint = schema_class.model_validate(raw).model_dump()
+            except ValidationError:
+                continue
+            datapoints.append(datapoint)
+        # All of the page's quotes are checked together; the markdown is
+        # normalized at most once, and only when some quote needs it
+        grounded = _check_groundings(datapoints, result.markdown)
+        for datapoint, is_grounded in zip(datapoints, grounded):
+            datapoint["is_grounded"] = is_grounded
+            if is_grounded:
+                datapoint["source"] = (
+                    f"{url}#:~:text={_quote_text_fragment(datapoint['grounding_quote'])}"
+                )
+            else:
+                datapoint["source"] = url
+    return datapoints
+
+
+async def _iter_extract(
     urls: List[str],
     schema: str,
     llm_config: LLMConfig,
-    extra_instruction: Optional[str] = None,
-    handle_pdfs: bool = False,
-    mistral_ocr_config: MistralOCRConfig = None,
-) -> List[Dict[str, Any]]:
+    extra_instruction: Optional[str],
+    handle_pdfs: bool,
+    mistral_ocr_config: Optional[MistralOCRConfig],
+    max_concurrency: int,
+    crawler: Optional[AsyncWebCrawler],
+) -> AsyncGenerator[Dict[str, Any], None]:
     """
-    Extract data from a list of URLs using a schema.
+    Shared extraction core streaming datapoints from a list of URLs.
 
     Args:
         urls: List of URLs to extract data from
@@ -124,22 +374,19 @@ async def extract_data(
         extra_instruction: Extra instruction for data extraction
         handle_pdfs: Whether to handle PDFs. If True, mistral_ocr_config is required
         mistral_ocr_config: Configuration for the Mistral OCR API
+        max_concurrency: Maximum number of URLs to process concurrently
+        crawler: Already-started crawler to reuse across calls. When omitted,
+            a new crawler (and browser) is started and closed per call
 
-    Returns:
-        List[Dict[str, Any]]: List of extracted data
+    Yields:
+        Dict[str, Any]: Extracted datapoint as it's processed or {"url_done": url} if the url is done being processed
     """
-    namespace = {
-        "BaseModel": BaseModel,
-        "Field": Field,
-        "Optional": Optional,
-        "List": List,
-    }
-    schema += '\n    grounding_quote: str = Field(..., description="Short span of text taken verbatim from the webpage from which the data is extracted (just a few words), EXACTLY as it appears in the text, DO NOT miss any words in the middle. DO NOT include \\\\ before apostrophes or other special characters.")'
-    class_name = schema.split("class ")[1].split("(")[0].strip()
-    exec(schema, namespace)
-    Schema = namespace[class_name]
+    if handle_pdfs and not mistral_ocr_config:
+        raise ValueError("mistral_ocr_config is required when handle_pdfs is True")
+
+    Schema, json_schema = _build_schema_class(schema + _GROUNDING_FIELD_SRC)
 
-    instruction = f"From the crawled content, extract all mentioned {class_name}. Only extract a value if it matches what the field describes - no related or similar information. "
+    instruction = f"From the crawled content, extract all mentioned {Schema.__name__}. Only extract a value if it matches what the field describes - no related or similar information. "
     if extra_instruction:
         instruction += extra_instruction
 
@@ -149,7 +396,7 @@ async def extract_data(
                 provider=llm_config.model,
                 api_token=llm_config.api_key,
             ),
-            schema=Schema.model_json_schema(),
+            schema=json_schema,
             extraction_type="schema",
             instruction=instruction,
             input_format="markdown",
@@ -157,42 +404,77 @@ async def extract_data(
         cache_mode=CacheMode.BYPASS,
     )
 
-    browser_config = BrowserConfig(verbose=True)
-    async with AsyncWebCrawler(config=browser_config) as crawler:
-        extracted_data = []
-        for url in urls:
-            if ".pdf" in url:
-                if not handle_pdfs:
-                    continue
-                if not mistral_ocr_config:
-                    raise ValueError(
-                        "mistral_ocr_config is required when handle_pdfs is True"
-                    )
-                to_extract = f"raw:{_extract_pdf_text(url, mistral_ocr_config)}"
-            else:
-                to_extract = url
-
-            result = await crawler.arun(url=to_extract, config=run_config)
-            if result and result.extracted_content:
-                try:
-                    data = json.loads(result.extracted_content)
-                    for datapoint in data:
-                        if not datapoint.get("error"):
-                            is_grounded, _ = _check_grounding(
-                                datapoint, result.markdown
-                            )
-                            datapoint["is_grounded"] = is_grounded
-                            if is_grounded:
-                                datapoint["source"] = (
-                                    f"{url}#:~:text={urllib.parse.quote(datapoint['grounding_quote'])}"
-                                )
-                            else:
-                                datapoint["source"] = url
-                            datapoint.pop("error")
-                            extracted_data.append(datapoint)
-                except json.JSONDecodeError:
-                    continue
+    semaphore = asyncio.Semaphore(max_concurrency)
+    queue: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue()
+
+    async def worker(url: str) -> None:
+        try:
+            datapoints = await _process_url(
+                url, crawler, run_config, semaphore, Schema, handle_pdfs, mistral_ocr_config
+            )
+            for datapoint in datapoints:
+                await queue.put(datapoint)
+        except Exception as e:
+            # Keep the batch going, but never swallow failures silently
+            logger.warning(f"Extraction failed for {url}: {e}")
+        finally:
+            await queue.put({"url_done": url})
+
+    async with contextlib.AsyncExitStack() as stack:
+        if crawler is None:
+            crawler = await stack.enter_async_context(
+                AsyncWebCrawler(config=BrowserConfig(verbose=True))
+            )
+        workers = [asyncio.create_task(worker(url)) for url in urls]
+        remaining = len(urls)
+        while remaining:
+            item = await queue.get()
+            if "url_done" in item:
+                remaining -= 1
+            yield item
+        await asyncio.gather(*workers)
+
+
+async def extract_data(
+    urls: List[str],
+    schema: str,
+    llm_config: LLMConfig,
+    extra_instruction: Optional[str] = None,
+    handle_pdfs: bool = False,
+    mistral_ocr_config: MistralOCRConfig = None,
+    max_concurrency: int = 8,
+    crawler: Optional[AsyncWebCrawler] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Extract data from a list of URLs using a schema.
+
+    Args:
+        urls: List of URLs to extract data from
+        schema: Schema to use for extraction
+        llm_config: Configuration for the LLM provider
+        extra_instruction: Extra instruction for data extraction
+        handle_pdfs: Whether to handle PDFs. If True, mistral_ocr_config is required
+        mistral_ocr_config: Configuration for the Mistral OCR API
+        max_concurrency: Maximum number of URLs to process concurrently
+        crawler: Already-started crawler to reuse across calls. When omitted,
+            a new crawler (and browser) is started and closed per call
 
+    Returns:
+        List[Dict[str, Any]]: List of extracted data
+    """
+    extracted_data = []
+    async for item in _iter_extract(
+        urls,
+        schema,
+        llm_config,
+        extra_instruction,
+        handle_pdfs,
+        mistral_ocr_config,
+        max_concurrency,
+        crawler,
+    ):
+        if "url_done" not in item:
+            extracted_data.append(item)
     return extracted_data
 
 
@@ -203,6 +485,8 @@ async def extract_data_streaming(
     extra_instruction: Optional[str] = None,
     handle_pdfs: bool = False,
     mistral_ocr_config: MistralOCRConfig = None,
+    max_concurrency: int = 8,
+    crawler: Optional[AsyncWebCrawler] = None,
 ) -> AsyncGenerator[Dict[str, Any], None]:
     """
     Extract data from a list of URLs using a schema and stream results as they come in.
@@ -214,73 +498,21 @@ async def extract_data_streaming(
         extra_instruction: Extra instruction for data extraction
         handle_pdfs: Whether to handle PDFs. If True, mistral_ocr_config is required
         mistral_ocr_config: Configuration for the Mistral OCR API
+        max_concurrency: Maximum number of URLs to process concurrently
+        crawler: Already-started crawler to reuse across calls. When omitted,
+            a new crawler (and browser) is started and closed per call
 
     Yields:
         Dict[str, Any]: Extracted datapoint as it's processed or {"url_done": url} if the url is done being processed
     """
-    namespace = {
-        "BaseModel": BaseModel,
-        "Field": Field,
-        "Optional": Optional,
-        "List": List,
-    }
-    schema += '\n    grounding_quote: str = Field(..., description="Short span of text taken verbatim from the webpage from which the data is extracted (just a few words), EXACTLY as it appears in the text, DO NOT miss any words in the middle. DO NOT include \\\\ before apostrophes or other special characters.")'
-    class_name = schema.split("class ")[1].split("(")[0].strip()
-    exec(schema, namespace)
-    Schema = namespace[class_name]
-
-    instruction = f"From the crawled content, extract all mentioned {class_name}. Only extract a value if it matches what the field describes - no related or similar information. "
-    if extra_instruction:
-        instruction += extra_instruction
-
-    run_config = CrawlerRunConfig(
-        extraction_strategy=LLMExtractionStrategy(
-            llm_config=Crawl4aiLLMConfig(
-                provider=llm_config.model,
-                api_token=llm_config.api_key,
-            ),
-            schema=Schema.model_json_schema(),
-            extraction_type="schema",
-            instruction=instruction,
-            input_format="markdown",
-        ),
-        cache_mode=CacheMode.BYPASS,
-    )
-
-    browser_config = BrowserConfig(verbose=True)
-    async with AsyncWebCrawler(config=browser_config) as crawler:
-        for url in urls:
-            if ".pdf" in url:
-                if not handle_pdfs:
-                    yield {"url_done": url}
-                    continue
-                if not mistral_ocr_config:
-                    raise ValueError(
-                        "mistral_ocr_config is required when handle_pdfs is True"
-                    )
-                to_extract = f"raw:{_extract_pdf_text(url, mistral_ocr_config)}"
-            else:
-                to_extract = url
-
-            result = await crawler.arun(url=to_extract, config=run_config)
-            if result and result.extracted_content:
-                try:
-                    data = json.loads(result.extracted_content)
-                    for datapoint in data:
-                        if not datapoint.get("error"):
-                            is_grounded, _ = _check_grounding(
-                                datapoint, result.markdown
-                            )
-                            datapoint["is_grounded"] = is_grounded
-                            if is_grounded:
-                                datapoint["source"] = (
-                                    f"{url}#:~:text={urllib.parse.quote(datapoint['grounding_quote'])}"
-                                )
-                            else:
-                                datapoint["source"] = url
-                            datapoint.pop("error")
-                            yield datapoint
-                except json.JSONDecodeError:
-                    yield {"url_done": url}
-                    continue
-            yield {"url_done": url}
+    async for item in _iter_extract(
+        urls,
+        schema,
+        llm_config,
+        extra_instruction,
+        handle_pdfs,
+        mistral_ocr_config,
+        max_concurrency,
+        crawler,
+    ):
+        yield item
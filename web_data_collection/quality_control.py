@@ -1,28 +1,25 @@
-import io
+import asyncio
 from typing import Dict, List
 
 import pandas as pd
 
 from .configs import LLMConfig
 from .prompts import QUALITY_CONTROL_PROMPT
-from .utils import perform_completion
+from .utils import aperform_completion, run_coroutine
 
+# Number of rows checked per LLM call
+CHUNK_SIZE = 50
 
-def control_quality(
-    extracted_data: List[Dict[str, str]],
-    dataset_description: str,
-    llm_config: LLMConfig,
-) -> Dict[str, str]:
+
+def _build_dataframe(extracted_data: List[Dict[str, str]]) -> pd.DataFrame:
     """
-    Control the quality of the extracted data by having an LLM check for issues in each datapoint.
+    Build the id-indexed DataFrame sent to the quality-control LLM.
 
     Args:
         extracted_data: List of extracted data
-        dataset_description: Description of the dataset
-        llm_config: Configuration for the LLM provider
 
     Returns:
-        Dict[str, str]: Dictionary of issues found in the extracted data
+        pd.DataFrame: DataFrame indexed by datapoint id
     """
     df = pd.DataFrame(extracted_data)
     if "url" in df.columns:
@@ -34,27 +31,91 @@ def control_quality(
     else:
         df.index = df.index + 1
     df = df.rename(columns={"index": "id"})
+    return df
 
-    csv_buffer = io.StringIO()
-    df.to_csv(csv_buffer, index=True)
-    csv_string = csv_buffer.getvalue()
 
-    prompt = QUALITY_CONTROL_PROMPT.format(
-        dataset_description=dataset_description,
-        extracted_data=csv_string,
-    )
+def _parse_issues(content: str) -> Dict[str, str]:
+    """
+    Parse the LLM response into a dictionary of issues keyed by id.
 
-    response = perform_completion(
-        prompt=prompt,
-        llm_config=llm_config,
-    )
-    content = response.choices[0].message.content
+    Args:
+        content: The LLM response content
 
+    Returns:
+        Dict[str, str]: Dictionary of issues found in the extracted data
+    """
     issues = {}
     for line in content.strip().split("\n"):
         if ":" in line:
             idx, issue = line.split(":", 1)
             idx = int(idx.strip())
             issues[str(idx)] = issue.strip()
+    return issues
+
+
+async def control_quality_async(
+    extracted_data: List[Dict[str, str]],
+    dataset_description: str,
+    llm_config: LLMConfig,
+    max_concurrency: int = 4,
+) -> Dict[str, str]:
+    """
+    Control the quality of the extracted data by having an LLM check for issues in each datapoint.
+
+    The data is split into chunks of CHUNK_SIZE rows and the chunks are
+    checked concurrently, so large datasets neither hit context limits
+    nor pay the latency of one giant prompt.
+
+    Args:
+        extracted_data: List of extracted data
+        dataset_description: Description of the dataset
+        llm_config: Configuration for the LLM provider
+        max_concurrency: Maximum number of concurrent LLM calls
+
+    Returns:
+        Dict[str, str]: Dictionary of issues found in the extracted data
+    """
+    df = _build_dataframe(extracted_data)
+
+    prompts = [
+        QUALITY_CONTROL_PROMPT.format(
+            dataset_description=dataset_description,
+            extracted_data=df.iloc[i : i + CHUNK_SIZE].to_csv(index=True),
+        )
+        for i in range(0, len(df), CHUNK_SIZE)
+    ]
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def complete(prompt: str):
+        async with semaphore:
+            return await aperform_completion(prompt, llm_config)
+
+    responses = await asyncio.gather(*(complete(prompt) for prompt in prompts))
+
+    issues = {}
+    for response in responses:
+        issues.update(_parse_issues(response.choices[0].message.content))
 
     return issues
+
+
+def control_quality(
+    extracted_data: List[Dict[str, str]],
+    dataset_description: str,
+    llm_config: LLMConfig,
+) -> Dict[str, str]:
+    """
+    Control the quality of the extracted data by having an LLM check for issues in each datapoint.
+
+    Args:
+        extracted_data: List of extracted data
+        dataset_description: Description of the dataset
+        llm_config: Configuration for the LLM provider
+
+    Returns:
+        Dict[str, str]: Dictionary of issues found in the extracted data
+    """
+    return run_coroutine(
+        control_quality_async(extracted_data, dataset_description, llm_config)
+    )
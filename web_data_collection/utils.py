@@ -1,10 +1,83 @@
-import signal
-from typing import Any, Callable, Dict, Optional, Union
+import asyncio
+import hashlib
+import json
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional, Union
 
-from litellm import completion
+from litellm import ModelResponse, acompletion, completion
 
 from .configs import LLMConfig
 
+# Shared executor for running sync functions with a timeout
+_EXECUTOR = ThreadPoolExecutor(max_workers=4)
+
+# Directory for the on-disk LLM response cache
+_LLM_CACHE_DIR = Path.home() / ".cache" / "web_data_collection" / "llm"
+
+
+def _completion_cache_path(prompt: str, llm_config: LLMConfig) -> Path:
+    """
+    Get the cache file path for a completion call.
+
+    Args:
+        prompt: The prompt to send to the LLM
+        llm_config: Configuration for the LLM provider
+
+    Returns:
+        Path: Cache file path keyed by (model, temperature, prompt)
+    """
+    key = hashlib.sha256(
+        json.dumps(
+            {
+                "model": llm_config.model,
+                "temperature": llm_config.temperature,
+                "prompt": prompt,
+            },
+            sort_keys=True,
+        ).encode()
+    ).hexdigest()
+    return _LLM_CACHE_DIR / f"{key}.json"
+
+
+def _completion_cache_lookup(
+    prompt: str, llm_config: LLMConfig
+) -> "tuple[Optional[Path], Optional[Any]]":
+    """
+    Look up a completion in the on-disk cache.
+
+    Args:
+        prompt: The prompt to send to the LLM
+        llm_config: Configuration for the LLM provider
+
+    Returns:
+        Tuple of (cache path, cached response). Both are None when caching
+        is disabled; the response is None on a cache miss.
+    """
+    if not llm_config.cache:
+        return None, None
+    cache_path = _completion_cache_path(prompt, llm_config)
+    if cache_path.exists():
+        perform_completion.stats["hits"] += 1
+        return cache_path, ModelResponse(**json.loads(cache_path.read_text()))
+    perform_completion.stats["misses"] += 1
+    return cache_path, None
+
+
+def _completion_cache_store(cache_path: Optional[Path], response: Any) -> None:
+    """
+    Store a completion response in the on-disk cache.
+
+    Args:
+        cache_path: Cache file path, or None when caching is disabled
+        response: The LLM response to store
+    """
+    if cache_path is None:
+        return
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    cache_path.write_text(json.dumps(response.model_dump()))
+
 
 def perform_completion(
     prompt: str,
@@ -13,6 +86,11 @@ def perform_completion(
     """
     Perform LLM completion.
 
+    When llm_config.cache is True, responses are cached on disk keyed by
+    (model, temperature, prompt) and identical calls return the cached
+    response without hitting the provider. Hit/miss counts are tracked in
+    perform_completion.stats.
+
     Args:
         prompt: The prompt to send to the LLM
         llm_config: Configuration for the LLM provider
@@ -20,6 +98,9 @@ def perform_completion(
     Returns:
         LLM response
     """
+    cache_path, cached = _completion_cache_lookup(prompt, llm_config)
+    if cached is not None:
+        return cached
 
     response = completion(
         model=llm_config.model,
@@ -27,18 +108,89 @@ def perform_completion(
         temperature=llm_config.temperature,
         messages=[{"role": "user", "content": prompt}],
     )
+
+    _completion_cache_store(cache_path, response)
     return response
 
 
-class TimeoutException(Exception):
-    """Exception raised when a function call times out."""
+perform_completion.stats = {"hits": 0, "misses": 0}
 
-    pass
 
+async def aperform_completion(
+    prompt: str,
+    llm_config: LLMConfig,
+) -> Any:
+    """
+    Perform LLM completion without blocking the event loop.
 
-def timeout_handler(signum: int, frame: Any) -> None:
-    """Signal handler for timeout."""
-    raise TimeoutException("Function call timed out")
+    Uses the same on-disk cache as perform_completion.
+
+    Args:
+        prompt: The prompt to send to the LLM
+        llm_config: Configuration for the LLM provider
+
+    Returns:
+        LLM response
+    """
+    cache_path, cached = _completion_cache_lookup(prompt, llm_config)
+    if cached is not None:
+        return cached
+
+    response = await acompletion(
+        model=llm_config.model,
+        api_key=llm_config.api_key,
+        temperature=llm_config.temperature,
+        messages=[{"role": "user", "content": prompt}],
+    )
+
+    _completion_cache_store(cache_path, response)
+    return response
+
+
+def run_coroutine(coro: Awaitable) -> Any:
+    """
+    Run a coroutine to completion from synchronous code.
+
+    asyncio.run raises when called while an event loop is already
+    running (e.g. in Jupyter, which keeps a loop alive between cells),
+    so in that case the coroutine runs on a fresh loop in a separate
+    thread instead.
+
+    Args:
+        coro: The coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+async def async_timeout(
+    awaitable: Awaitable,
+    timeout: int = 5,
+    default_value: Any = None,
+) -> Any:
+    """
+    Await an awaitable with a timeout.
+
+    Args:
+        awaitable: The awaitable to wait for
+        timeout: Timeout in seconds
+        default_value: Value to return if timeout occurs
+
+    Returns:
+        Awaitable result or default_value if timeout occurs
+    """
+    try:
+        return await asyncio.wait_for(awaitable, timeout)
+    except asyncio.TimeoutError:
+        return default_value
 
 
 def timeout_function(
@@ -51,6 +203,9 @@ def timeout_function(
     """
     Wrap a function with a timeout.
 
+    The function runs in a shared thread pool, so this is safe to call
+    from any thread and alongside async code.
+
     Args:
         func: Function to execute
         args: Positional arguments for the function
@@ -60,20 +215,13 @@ def timeout_function(
 
     Returns:
         Function result or default_value if timeout occurs
-
-    Note:
-        This function uses signal.SIGALRM which is Unix-specific.
-        On Windows, this will not work as expected.
     """
     if kwargs is None:
         kwargs = {}
 
-    signal.signal(signal.SIGALRM, timeout_handler)
-    signal.alarm(timeout)
-
+    future = _EXECUTOR.submit(func, *args, **kwargs)
     try:
-        result = func(*args, **kwargs)
-        signal.alarm(0)
-        return result
-    except TimeoutException:
+        return future.result(timeout=timeout)
+    except FuturesTimeoutError:
+        future.cancel()
         return default_value
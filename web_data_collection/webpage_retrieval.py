@@ -1,27 +1,172 @@
+import asyncio
+import contextlib
+import hashlib
 import itertools
-import json
 import logging
+import math
 import os
+import re
 import urllib.parse
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, Generator, List, Optional, Tuple
-
+from typing import (
+    Any,
+    AsyncGenerator,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+import aiohttp
+import httpx
+import orjson
+import pandas as pd
 import requests
 from htmldate import find_date
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .configs import BrightDataConfig, JinaConfig
-from .utils import timeout_function
+from .utils import async_timeout, run_coroutine, timeout_function
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    from pybloom_live import ScalableBloomFilter
+except ImportError:
+    ScalableBloomFilter = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Shared HTTP session: every Bright Data call hits the same host, so one
+# pooled session avoids a TCP + TLS handshake per page request. Transient
+# failures are retried with backoff instead of re-running the caller.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=50,
+        pool_maxsize=50,
+        max_retries=Retry(
+            total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]
+        ),
+    ),
+)
+
+# Shared Jina client: all rerank groups (including concurrent ones from
+# the thread pool) multiplex over one HTTP/2 TLS session instead of
+# paying a handshake per call
+_JINA_CLIENT = httpx.Client(
+    http2=True,
+    timeout=60.0,
+    limits=httpx.Limits(max_connections=16, max_keepalive_connections=16),
+)
+
 # File paths
 MODULE_DIR = Path(__file__).parent
 DATA_DIR = MODULE_DIR / "data"
 COUNTRY_TO_CODE_FILE = DATA_DIR / "country_to_code.json"
 COUNTRY_TO_MC_SOURCES_FILE = DATA_DIR / "country_to_mc_sources.json"
 
+# Country name -> geolocation code mapping, parsed once at import instead
+# of once per page request
+_COUNTRY_NAME_TO_CODE = orjson.loads(Path(COUNTRY_TO_CODE_FILE).read_bytes())
+
+# Results requested per Bright Data page (num=20 in the SERP URL); a page
+# with fewer results is the last one
+_RESULTS_PER_PAGE = 20
+
+
+class SerpResult(NamedTuple):
+    """
+    A single search result from Bright Data.
+
+    A NamedTuple is used instead of a per-result dict to keep memory
+    overhead low on large crawls; source is only set for news results.
+    """
+
+    link: str
+    title: str
+    description: str
+    source: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, str]:
+        """
+        Convert the result to a JSON-serializable dictionary.
+
+        Returns:
+            Dictionary with link, title and description keys, plus source
+            for news results
+        """
+        result = {
+            "link": self.link,
+            "title": self.title,
+            "description": self.description,
+        }
+        if self.source is not None:
+            result["source"] = self.source
+        return result
+
+
+class DateChunk(NamedTuple):
+    """
+    One date range covered by a single Bright Data query.
+
+    A NamedTuple is used instead of a per-chunk dict so long-running
+    ranges with many chunks stay cheap to build and carry around.
+    """
+
+    start: str
+    end: str
+
+    def to_dict(self) -> Dict[str, str]:
+        """
+        Convert the chunk to a JSON-serializable dictionary.
+
+        Returns:
+            Dictionary with start and end date keys
+        """
+        return {"start": self.start, "end": self.end}
+
+
+class RerankHit(NamedTuple):
+    """
+    A single reranked document returned by the Jina API.
+
+    A NamedTuple is used instead of a per-hit dict to keep memory
+    overhead low when reranking large result sets.
+    """
+
+    query: str
+    text: str
+    score: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the hit to a JSON-serializable dictionary.
+
+        Returns:
+            Dictionary with query, text and score keys
+        """
+        return {"query": self.query, "text": self.text, "score": self.score}
+
 
 def retrieve_webpages(
     search_query_templates: List[str],
@@ -31,10 +176,12 @@ def retrieve_webpages(
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
     time_chunking: bool = False,
+    chunk_days: int = 366,
     media_cloud_country: Optional[str] = None,
     geolocation_country: Optional[str] = None,
     news_only: bool = False,
-) -> Dict[Optional[Tuple[str, ...]], Dict[str, List[Dict[str, str]]]]:
+    approximate_dedup: bool = False,
+) -> Dict[Optional[Tuple[str, ...]], Dict[str, List[SerpResult]]]:
     """
     Retrieve webpages based on search query templates.
 
@@ -46,9 +193,11 @@ def retrieve_webpages(
         start_date: Start date for search filtering (YYYY-MM-DD format)
         end_date: End date for search filtering (YYYY-MM-DD format)
         time_chunking: Whether to split date range into chunks
+        chunk_days: Maximum number of days per chunk when time chunking
         media_cloud_country: Country for Media Cloud source filtering
         geolocation_country: Country for geolocation filtering
         news_only: Whether to search only news results
+        approximate_dedup: Whether to deduplicate URLs with a bloom filter instead of an exact set
 
     Returns:
         Dictionary mapping variable combinations to queries to their results
@@ -65,7 +214,7 @@ def retrieve_webpages(
 
         # Handle date chunking
         date_chunks = _get_date_chunks_for_retrieval(
-            start_date, end_date, time_chunking
+            start_date, end_date, time_chunking, chunk_days
         )
 
         # Get Media Cloud sources if specified
@@ -81,6 +230,7 @@ def retrieve_webpages(
             media_cloud_sources,
             geolocation_country,
             news_only,
+            approximate_dedup,
         )
 
     except Exception as e:
@@ -88,6 +238,78 @@ def retrieve_webpages(
         raise Exception(f"Failed to retrieve webpages: {e}") from e
 
 
+async def retrieve_webpages_async(
+    search_query_templates: List[str],
+    results_pages_per_query: int,
+    bright_data_config: BrightDataConfig,
+    search_query_variables: Optional[Dict[str, List[str]]] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    time_chunking: bool = False,
+    chunk_days: int = 366,
+    media_cloud_country: Optional[str] = None,
+    geolocation_country: Optional[str] = None,
+    news_only: bool = False,
+    approximate_dedup: bool = False,
+    max_concurrent_requests: int = 20,
+) -> Dict[Optional[Tuple[str, ...]], Dict[str, List[SerpResult]]]:
+    """
+    Retrieve webpages based on search query templates, processing queries and date chunks concurrently.
+
+    Args:
+        search_query_templates: List of search query templates
+        results_pages_per_query: Number of result pages to retrieve per query
+        bright_data_config: Bright Data API configuration
+        search_query_variables: Dictionary mapping variable names to possible values
+        start_date: Start date for search filtering (YYYY-MM-DD format)
+        end_date: End date for search filtering (YYYY-MM-DD format)
+        time_chunking: Whether to split date range into chunks
+        chunk_days: Maximum number of days per chunk when time chunking
+        media_cloud_country: Country for Media Cloud source filtering
+        geolocation_country: Country for geolocation filtering
+        news_only: Whether to search only news results
+        approximate_dedup: Whether to deduplicate URLs with a bloom filter instead of an exact set
+        max_concurrent_requests: Maximum number of query/date-chunk fetches in flight at once
+
+    Returns:
+        Dictionary mapping variable combinations to queries to their results
+    """
+    try:
+        # Expand query templates
+        search_queries, variable_value_combinations = _expand_query_templates(
+            search_query_templates, search_query_variables
+        )
+        logger.debug(
+            f"Expanded {len(search_query_templates)} templates into {len(search_queries)} queries"
+        )
+
+        # Handle date chunking
+        date_chunks = _get_date_chunks_for_retrieval(
+            start_date, end_date, time_chunking, chunk_days
+        )
+
+        # Get Media Cloud sources if specified
+        media_cloud_sources = _get_media_cloud_sources_if_needed(media_cloud_country)
+
+        # Process queries and retrieve results
+        return await _process_queries_and_retrieve_results_async(
+            search_queries,
+            variable_value_combinations,
+            date_chunks,
+            results_pages_per_query,
+            bright_data_config,
+            media_cloud_sources,
+            geolocation_country,
+            news_only,
+            max_concurrent_requests,
+            approximate_dedup,
+        )
+
+    except Exception as e:
+        logger.error(f"Error in retrieve_webpages_async: {e}")
+        raise Exception(f"Failed to retrieve webpages: {e}") from e
+
+
 def retrieve_webpages_streaming(
     search_query_templates: List[str],
     results_pages_per_query: int,
@@ -96,13 +318,15 @@ def retrieve_webpages_streaming(
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
     time_chunking: bool = False,
+    chunk_days: int = 366,
     media_cloud_country: Optional[str] = None,
     geolocation_country: Optional[str] = None,
     news_only: bool = False,
+    approximate_dedup: bool = False,
     variable_name_with_assigned_countries: Optional[str] = None,
     variable_values_media_cloud_countries: Optional[Dict[str, str]] = None,
     variable_values_geolocation_countries: Optional[Dict[str, str]] = None,
-) -> Generator[Tuple[Optional[Tuple[str, ...]], str, Dict[str, str]], None, None]:
+) -> Generator[Tuple[Optional[Tuple[str, ...]], str, SerpResult], None, None]:
     """
     Retrieve webpages based on search query templates and stream results as they come in.
 
@@ -114,9 +338,11 @@ def retrieve_webpages_streaming(
         start_date: Start date for search filtering (YYYY-MM-DD format)
         end_date: End date for search filtering (YYYY-MM-DD format)
         time_chunking: Whether to split date range into chunks
+        chunk_days: Maximum number of days per chunk when time chunking
         media_cloud_country: Country for Media Cloud source filtering
         geolocation_country: Country for geolocation filtering
         news_only: Whether to search only news results
+        approximate_dedup: Whether to deduplicate URLs with a bloom filter instead of an exact set
         variable_name_with_assigned_countries: Name of the variable whose values we are assigning countries to
         variable_values_media_cloud_countries: Dictionary mapping variable values to Media Cloud countries
         variable_values_geolocation_countries: Dictionary mapping variable values to geolocation countries
@@ -125,7 +351,7 @@ def retrieve_webpages_streaming(
         Tuple containing:
             - variable_value_combo: The variable value combination for this query (or None)
             - query: The search query that produced this result
-            - result: Dictionary containing the search result (link, title, description, etc.)
+            - result: The search result (link, title, description, etc.)
     """
     assert not (
         variable_name_with_assigned_countries
@@ -143,7 +369,7 @@ def retrieve_webpages_streaming(
 
         # Handle date chunking
         date_chunks = _get_date_chunks_for_retrieval(
-            start_date, end_date, time_chunking
+            start_date, end_date, time_chunking, chunk_days
         )
 
         # Get Media Cloud sources if specified
@@ -170,6 +396,7 @@ def retrieve_webpages_streaming(
             media_cloud_sources,
             geolocation_country,
             news_only,
+            approximate_dedup,
             variable_name_with_assigned_countries,
             variable_values_media_cloud_sources,
             variable_values_geolocation_countries,
@@ -182,8 +409,11 @@ def retrieve_webpages_streaming(
 
 
 def _get_date_chunks_for_retrieval(
-    start_date: Optional[str], end_date: Optional[str], time_chunking: bool
-) -> List[Dict[str, str]]:
+    start_date: Optional[str],
+    end_date: Optional[str],
+    time_chunking: bool,
+    chunk_days: int = 366,
+) -> List[DateChunk]:
     """
     Get date chunks for retrieval.
 
@@ -191,15 +421,16 @@ def _get_date_chunks_for_retrieval(
         start_date: Start date for search filtering (YYYY-MM-DD format)
         end_date: End date for search filtering (YYYY-MM-DD format)
         time_chunking: Whether to split date range into chunks
+        chunk_days: Maximum number of days per chunk
 
     Returns:
-        List of dictionaries containing start and end dates for each chunk
+        List of date chunks covering the range
     """
     if time_chunking:
-        date_chunks = _get_date_chunks(start_date, end_date)
+        date_chunks = _get_date_chunks(start_date, end_date, chunk_days)
         logger.debug(f"Created {len(date_chunks)} date chunks for time chunking")
     else:
-        date_chunks = [{"start": start_date, "end": end_date}]
+        date_chunks = [DateChunk(start_date, end_date)]
 
     return date_chunks
 
@@ -225,6 +456,20 @@ def _get_media_cloud_sources_if_needed(
     return None
 
 
+@lru_cache(maxsize=1024)
+def _norm(name: str) -> str:
+    """
+    Normalize a variable name to placeholder form.
+
+    Args:
+        name: Variable name as provided by the caller
+
+    Returns:
+        str: Lowercased name with spaces replaced by underscores
+    """
+    return name.lower().replace(" ", "_")
+
+
 def _get_variable_value_for_country_assignment(
     variable_value_combo: Optional[Tuple[str, ...]],
     variable_name_with_assigned_countries: str,
@@ -244,15 +489,38 @@ def _get_variable_value_for_country_assignment(
     if not variable_value_combo or not search_query_variables:
         return None
 
+    var_index = _resolve_country_var_index(
+        variable_name_with_assigned_countries, tuple(search_query_variables.keys())
+    )
+    if var_index is not None and var_index < len(variable_value_combo):
+        return variable_value_combo[var_index]
+    return None
+
+
+@lru_cache(maxsize=None)
+def _resolve_country_var_index(
+    variable_name_with_assigned_countries: str,
+    variable_names: Tuple[str, ...],
+) -> Optional[int]:
+    """
+    Resolve the position of the country-assignment variable in the combo tuple.
+
+    The normalized-name map and index lookup are invariant for a given set of
+    variable names, so the result is cached and the per-result cost is O(1).
+
+    Args:
+        variable_name_with_assigned_countries: Name of the variable whose values we are assigning countries to
+        variable_names: Tuple of variable names, in search_query_variables order
+
+    Returns:
+        Index of the variable in the combination tuple, or None if not found
+    """
     # Normalize variable names to match the format used in _expand_query_templates
     normalized_variable_names = {
-        k.lower().replace(" ", "_"): k for k in search_query_variables.keys()
+        _norm(name): index for index, name in enumerate(variable_names)
     }
 
-    # Find the normalized name for the variable we're looking for
-    target_normalized_name = variable_name_with_assigned_countries.lower().replace(
-        " ", "_"
-    )
+    target_normalized_name = _norm(variable_name_with_assigned_countries)
 
     if target_normalized_name not in normalized_variable_names:
         logger.warning(
@@ -260,51 +528,85 @@ def _get_variable_value_for_country_assignment(
         )
         return None
 
-    # Get the original variable name
-    original_var_name = normalized_variable_names[target_normalized_name]
+    return normalized_variable_names[target_normalized_name]
 
-    # Find the position of this variable in the search_query_variables
-    var_names = list(search_query_variables.keys())
-    try:
-        var_index = var_names.index(original_var_name)
-        if var_index < len(variable_value_combo):
-            return variable_value_combo[var_index]
-    except (ValueError, IndexError):
-        logger.warning(
-            f"Could not find variable '{original_var_name}' in variable value combination"
-        )
 
-    return None
+def _url_hash(url: str) -> int:
+    """
+    Hash a URL to a fixed-size 64-bit int for deduplication.
+
+    Storing 8-byte digests instead of full URL strings keeps the seen-URL
+    sets small on large crawls; collisions at 2^64 are negligible.
+
+    Args:
+        url: URL to hash
+
+    Returns:
+        64-bit integer digest of the URL
+    """
+    return int.from_bytes(
+        hashlib.blake2b(url.encode(), digest_size=8).digest(), "big"
+    )
+
+
+def _make_seen_urls(approximate_dedup: bool = False) -> Any:
+    """
+    Create the structure tracking already-seen URL hashes.
+
+    Both variants support the `in` check and .add used by the retrieval
+    paths. The exact set is the default; the scalable bloom filter trades
+    a small false-positive rate (occasionally dropping a never-seen URL)
+    for a roughly 8-16x smaller footprint on very large crawls.
+
+    Args:
+        approximate_dedup: Whether to use a bloom filter instead of an exact set
+
+    Returns:
+        An empty set, or a ScalableBloomFilter when approximate_dedup is True
+
+    Raises:
+        ImportError: If approximate_dedup is True and pybloom_live is not installed
+    """
+    if not approximate_dedup:
+        return set()
+    if ScalableBloomFilter is None:
+        raise ImportError(
+            "pybloom_live is required for approximate deduplication; "
+            "install it or use approximate_dedup=False"
+        )
+    return ScalableBloomFilter(initial_capacity=100_000, error_rate=0.001)
 
 
 def _process_queries_and_retrieve_results(
     search_queries: List[str],
     variable_value_combinations: List[Optional[Tuple[str, ...]]],
-    date_chunks: List[Dict[str, str]],
+    date_chunks: List[DateChunk],
     results_pages_per_query: int,
     bright_data_config: BrightDataConfig,
     media_cloud_sources: Optional[List[str]],
     geolocation_country: Optional[str],
     news_only: bool,
-) -> Dict[Optional[Tuple[str, ...]], Dict[str, List[Dict[str, str]]]]:
+    approximate_dedup: bool = False,
+) -> Dict[Optional[Tuple[str, ...]], Dict[str, List[SerpResult]]]:
     """
     Process queries and retrieve results from all date chunks.
 
     Args:
         search_queries: List of search query strings to process
         variable_value_combinations: List of variable value combinations corresponding to each query
-        date_chunks: List of date range dictionaries with 'start' and 'end' keys
+        date_chunks: List of date chunks to query over
         results_pages_per_query: Number of result pages to retrieve per query
         bright_data_config: Configuration for Bright Data API
         media_cloud_sources: Optional list of Media Cloud source URLs to filter by
         geolocation_country: Optional country code for geolocation filtering
         news_only: Whether to retrieve only news results
+        approximate_dedup: Whether to deduplicate URLs with a bloom filter instead of an exact set
 
     Returns:
         Dictionary mapping variable value combinations to queries to their results
     """
-    results: Dict[Optional[Tuple[str, ...]], Dict[str, List[Dict[str, str]]]] = {}
-    seen_urls = set()
+    results: Dict[Optional[Tuple[str, ...]], Dict[str, List[SerpResult]]] = {}
+    seen_urls = _make_seen_urls(approximate_dedup)
 
     for query, variable_value_combo in zip(search_queries, variable_value_combinations):
         logger.debug(
@@ -331,57 +633,397 @@ def _process_queries_and_retrieve_results(
     return results
 
 
+async def _process_queries_and_retrieve_results_async(
+    search_queries: List[str],
+    variable_value_combinations: List[Optional[Tuple[str, ...]]],
+    date_chunks: List[DateChunk],
+    results_pages_per_query: int,
+    bright_data_config: BrightDataConfig,
+    media_cloud_sources: Optional[List[str]],
+    geolocation_country: Optional[str],
+    news_only: bool,
+    max_concurrent_requests: int = 20,
+    approximate_dedup: bool = False,
+) -> Dict[Optional[Tuple[str, ...]], Dict[str, List[SerpResult]]]:
+    """
+    Process queries concurrently and retrieve results from all date chunks.
+
+    The (query, date chunk) pairs are flattened into one task list and
+    fetched under a shared concurrency bound, so independent Bright Data
+    calls no longer wait on each other.
+
+    Args:
+        search_queries: List of search query strings to process
+        variable_value_combinations: List of variable value combinations corresponding to each query
+        date_chunks: List of date chunks to query over
+        results_pages_per_query: Number of result pages to retrieve per query
+        bright_data_config: Configuration for Bright Data API
+        media_cloud_sources: Optional list of Media Cloud source URLs to filter by
+        geolocation_country: Optional country code for geolocation filtering
+        news_only: Whether to retrieve only news results
+        max_concurrent_requests: Maximum number of query/date-chunk fetches in flight at once
+        approximate_dedup: Whether to deduplicate URLs with a bloom filter instead of an exact set
+
+    Returns:
+        Dictionary mapping variable value combinations to queries to their results
+    """
+    # Pre-populate the nested dict shape so every (combo, query) pair gets
+    # an entry even when it yields no results
+    results: Dict[Optional[Tuple[str, ...]], Dict[str, List[SerpResult]]] = {}
+    for query, variable_value_combo in zip(
+        search_queries, variable_value_combinations
+    ):
+        results.setdefault(variable_value_combo, {}).setdefault(query, [])
+
+    async for variable_value_combo, query, result in _collect_results_async(
+        search_queries,
+        variable_value_combinations,
+        date_chunks,
+        results_pages_per_query,
+        bright_data_config,
+        media_cloud_sources,
+        geolocation_country,
+        news_only,
+        max_concurrent_requests,
+        approximate_dedup,
+    ):
+        results[variable_value_combo][query].append(result)
+
+    return results
+
+
+async def _collect_results_async(
+    search_queries: List[str],
+    variable_value_combinations: List[Optional[Tuple[str, ...]]],
+    date_chunks: List[DateChunk],
+    results_pages_per_query: int,
+    bright_data_config: BrightDataConfig,
+    media_cloud_sources: Optional[List[str]],
+    geolocation_country: Optional[str],
+    news_only: bool,
+    max_concurrent_requests: int = 20,
+    approximate_dedup: bool = False,
+) -> AsyncGenerator[Tuple[Optional[Tuple[str, ...]], str, SerpResult], None]:
+    """
+    Fetch all (query, date chunk) pairs concurrently and yield deduplicated results.
+
+    This is the shared async core behind the dict-shaped API; it streams
+    (combo, query, result) tuples as fetches complete, so callers that
+    want incremental output can consume it directly.
+
+    Args:
+        search_queries: List of search query strings to process
+        variable_value_combinations: List of variable value combinations corresponding to each query
+        date_chunks: List of date chunks to query over
+        results_pages_per_query: Number of result pages to retrieve per query
+        bright_data_config: Configuration for Bright Data API
+        media_cloud_sources: Optional list of Media Cloud source URLs to filter by
+        geolocation_country: Optional country code for geolocation filtering
+        news_only: Whether to retrieve only news results
+        max_concurrent_requests: Maximum number of query/date-chunk fetches in flight at once
+        approximate_dedup: Whether to deduplicate URLs with a bloom filter instead of an exact set
+
+    Yields:
+        Tuple containing:
+            - variable_value_combo: The variable value combination for this query (or None)
+            - query: The search query that produced this result
+            - result: The search result (link, title, description, etc.)
+    """
+    # Flatten queries x date chunks into independent fetch tasks
+    task_keys = [
+        (variable_value_combo, query, chunk)
+        for query, variable_value_combo in zip(
+            search_queries, variable_value_combinations
+        )
+        for chunk in date_chunks
+    ]
+
+    semaphore = asyncio.Semaphore(max_concurrent_requests)
+    queue: "asyncio.Queue" = asyncio.Queue()
+    task_done = object()
+
+    async def produce(
+        variable_value_combo: Optional[Tuple[str, ...]],
+        query: str,
+        chunk: DateChunk,
+        session: aiohttp.ClientSession,
+    ) -> None:
+        try:
+            async with semaphore:
+                chunk_results = await _retrieve_bright_data_results_async(
+                    query,
+                    results_pages_per_query,
+                    bright_data_config,
+                    chunk.start,
+                    chunk.end,
+                    media_cloud_sources,
+                    geolocation_country,
+                    news_only,
+                    session=session,
+                )
+            for result in chunk_results:
+                await queue.put((variable_value_combo, query, result))
+        finally:
+            # Always signal completion so the consumer loop terminates
+            # even when the fetch raises
+            await queue.put(task_done)
+
+    async with aiohttp.ClientSession() as session:
+        producers = [
+            asyncio.ensure_future(
+                produce(variable_value_combo, query, chunk, session)
+            )
+            for variable_value_combo, query, chunk in task_keys
+        ]
+
+        # Single consumer owns seen_urls, so dedup needs no locking even
+        # though producers run concurrently
+        seen_urls = _make_seen_urls(approximate_dedup)
+        pending = len(task_keys)
+        while pending:
+            item = await queue.get()
+            if item is task_done:
+                pending -= 1
+                continue
+            _variable_value_combo, _query, result = item
+            url_hash = _url_hash(result.link)
+            if url_hash not in seen_urls:
+                seen_urls.add(url_hash)
+                yield item
+
+        # Surface any fetch errors after draining the queue
+        await asyncio.gather(*producers)
+
+
 def _process_date_chunks(
     query: str,
-    date_chunks: List[Dict[str, str]],
+    date_chunks: List[DateChunk],
     results_pages_per_query: int,
     bright_data_config: BrightDataConfig,
     media_cloud_sources: Optional[List[str]],
     geolocation_country: Optional[str],
     news_only: bool,
     seen_urls: set,
-) -> List[Dict[str, str]]:
+) -> List[SerpResult]:
     """
     Process all date chunks for a single query.
 
     Args:
         query: Search query string to process
-        date_chunks: List of date range dictionaries with 'start' and 'end' keys
+        date_chunks: List of date chunks to query over
         results_pages_per_query: Number of result pages to retrieve per query
         bright_data_config: Configuration for Bright Data API
         media_cloud_sources: Optional list of Media Cloud source URLs to filter by
         geolocation_country: Optional country code for geolocation filtering
         news_only: Whether to retrieve only news results
-        seen_urls: Set of URLs already processed to avoid duplicates
+        seen_urls: Set of hashed URLs already processed to avoid duplicates
 
     Returns:
-        List of search result dictionaries from all date chunks
+        List of search results from all date chunks
     """
-    all_chunk_results = []
-
-    for chunk in date_chunks:
-        logger.debug(f"Processing date chunk: {chunk['start']} to {chunk['end']}")
-
-        chunk_results = _retrieve_bright_data_results(
+    # The streaming core owns pagination and dedup; this just collects
+    return [
+        result
+        for _variable_value_combo, _query, result in _stream_date_chunks(
             query,
+            None,
+            date_chunks,
             results_pages_per_query,
             bright_data_config,
-            chunk["start"],
-            chunk["end"],
             media_cloud_sources,
             geolocation_country,
             news_only,
+            seen_urls,
         )
+    ]
+
+
+def _build_search_query(
+    query: str,
+    start_date: Optional[str],
+    end_date: Optional[str],
+    media_cloud_sources: Optional[List[str]],
+    num_mc_sites: int = 50,
+) -> str:
+    """
+    Append date and Media Cloud site filters to a search query.
+
+    Args:
+        query: Search query string
+        start_date: Start date for search filtering (YYYY-MM-DD format)
+        end_date: End date for search filtering (YYYY-MM-DD format)
+        media_cloud_sources: Optional list of Media Cloud source URLs to filter by
+        num_mc_sites: Maximum number of Media Cloud sites to include in query
+
+    Returns:
+        str: The query with filters appended
+    """
+    date_filters = []
+    if start_date:
+        date_filters.append(f"after:{start_date}")
+    if end_date:
+        date_filters.append(f"before:{end_date}")
+    if date_filters:
+        query = f"{query} {' '.join(date_filters)}"
+        logger.debug(f"Added date filters: {date_filters}")
+
+    if media_cloud_sources:
+        mc_filter = _media_cloud_filter(tuple(media_cloud_sources), num_mc_sites)
+        if mc_filter:
+            query = f"{query} {mc_filter}"
+
+    return query
+
+
+@lru_cache(maxsize=256)
+def _media_cloud_filter(
+    media_cloud_sources: Tuple[str, ...], num_mc_sites: int
+) -> str:
+    """
+    Build the site: filter fragment for a set of Media Cloud sources.
+
+    The same fragment is appended to every (query, date chunk) pair of a
+    run, so the O(num_mc_sites) join is cached instead of rebuilt per
+    page request.
+
+    Args:
+        media_cloud_sources: Tuple of Media Cloud source URLs
+        num_mc_sites: Maximum number of Media Cloud sites to include
+
+    Returns:
+        str: OR-joined site: filters for the first num_mc_sites sources
+    """
+    mc_filters = [f"site:{site}" for site in media_cloud_sources[:num_mc_sites]]
+    logger.debug(f"Built filter for {len(mc_filters)} Media Cloud sites")
+    return " OR ".join(mc_filters)
+
+
+def _get_country_code(geolocation_country: Optional[str]) -> Optional[str]:
+    """
+    Convert a country name to its geolocation code.
+
+    Args:
+        geolocation_country: Optional country name for geolocation filtering
+
+    Returns:
+        Optional[str]: The country code, or None if no country was given
+    """
+    if not geolocation_country:
+        return None
+    country_code = _COUNTRY_NAME_TO_CODE.get(geolocation_country)
+    assert country_code, f"Could not find country code for '{geolocation_country}'"
+    logger.debug(f"Found geolocation country code: {country_code}")
+    return country_code
+
+
+# Result fields kept per item; news results additionally carry a source
+_ORGANIC_FIELDS = ("link", "title", "description")
+_NEWS_FIELDS = ("link", "title", "description", "source")
+_GET_ORGANIC = itemgetter(*_ORGANIC_FIELDS)
+_GET_NEWS = itemgetter(*_NEWS_FIELDS)
+
+
+def _build_results(
+    result_items: Iterable[Dict[str, Any]], news_only: bool
+) -> List[SerpResult]:
+    """
+    Build SerpResults from raw result items.
+
+    Args:
+        result_items: Iterable of raw result dictionaries
+        news_only: Whether the request was a news-only search
 
-        # Filter out duplicate URLs
-        unique_results = [r for r in chunk_results if r["link"] not in seen_urls]
-        seen_urls.update([r["link"] for r in unique_results])
-        all_chunk_results.extend(unique_results)
+    Returns:
+        List of search results
+    """
+    fields = _NEWS_FIELDS if news_only else _ORGANIC_FIELDS
+    getter = _GET_NEWS if news_only else _GET_ORGANIC
+
+    simplified_results = []
+    for item in result_items:
+        try:
+            # Fast path: one itemgetter call instead of one .get per field
+            simplified_results.append(SerpResult(*getter(item)))
+        except KeyError:
+            simplified_results.append(
+                SerpResult(*(item.get(field, "") for field in fields))
+            )
+    return simplified_results
+
+
+def _parse_result_items(
+    results: Dict[str, Any], news_only: bool
+) -> List[SerpResult]:
+    """
+    Extract simplified results from a Bright Data response.
+
+    Args:
+        results: Parsed JSON response from Bright Data
+        news_only: Whether the request was a news-only search
+
+    Returns:
+        List of search results
+    """
+    result_key = "news" if news_only else "organic"
+    return _build_results(results.get(result_key, []), news_only)
+
+
+def _fetch_page_results(
+    data: Dict[str, str],
+    headers: Dict[str, str],
+    bright_data_config: BrightDataConfig,
+    news_only: bool,
+) -> List[SerpResult]:
+    """
+    Fetch one Bright Data result page over the shared session and parse it.
 
-    return all_chunk_results
+    When ijson is installed the response body is stream-parsed instead of
+    buffered whole, keeping peak memory per request at a small parser
+    buffer; otherwise the full body is parsed with orjson.
 
+    Args:
+        data: Request payload for one result page
+        headers: Request headers including authorization
+        bright_data_config: Configuration for Bright Data API
+        news_only: Whether to retrieve only news results
+
+    Returns:
+        List of search results
+    """
+    if ijson is not None:
+        result_key = "news" if news_only else "organic"
+        with _SESSION.post(
+            bright_data_config.base_url, headers=headers, json=data, stream=True
+        ) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            return _build_results(
+                ijson.items(response.raw, f"{result_key}.item"), news_only
+            )
+
+    response = _SESSION.post(bright_data_config.base_url, headers=headers, json=data)
+    response.raise_for_status()
+    return _parse_result_items(orjson.loads(response.content), news_only)
 
-def _retrieve_bright_data_results(
+
+@lru_cache(maxsize=4096)
+def _quote_plus_cached(text: str) -> str:
+    """
+    URL-encode a query string, caching the result for repeated queries.
+
+    The same final query is encoded once per result page and again on
+    every re-fetch, so a small cache skips the encoder for repeats.
+
+    Args:
+        text: Query string to encode
+
+    Returns:
+        str: The URL-encoded query
+    """
+    return urllib.parse.quote_plus(text)
+
+
+def _build_serp_payloads(
     query: str,
     results_pages_per_query: int,
     bright_data_config: BrightDataConfig,
@@ -393,7 +1035,7 @@ def _retrieve_bright_data_results(
     num_mc_sites: int = 50,
 ) -> List[Dict[str, str]]:
     """
-    Retrieve search results from Bright Data API for a given query.
+    Build the Bright Data request payloads for every result page of a query.
 
     Args:
         query: Search query string
@@ -407,89 +1049,95 @@ def _retrieve_bright_data_results(
         num_mc_sites: Maximum number of Media Cloud sites to include in query
 
     Returns:
-        List of search result dictionaries
+        List of request payload dictionaries, one per result page
     """
-    # Build query with date filters
-    date_filters = []
-    if start_date:
-        date_filters.append(f"after:{start_date}")
-    if end_date:
-        date_filters.append(f"before:{end_date}")
-    if date_filters:
-        query = f"{query} {' '.join(date_filters)}"
-        logger.debug(f"Added date filters: {date_filters}")
+    query = _build_search_query(
+        query, start_date, end_date, media_cloud_sources, num_mc_sites
+    )
+    encoded_query = _quote_plus_cached(query)
 
-    # Add Media Cloud collection sites to query if provided
-    if media_cloud_sources:
-        media_cloud_sources = media_cloud_sources[:num_mc_sites]  # truncate sites
-        mc_filters = [f"site:{site}" for site in media_cloud_sources]
-        if mc_filters:
-            query = f"{query} {' OR '.join(mc_filters)}"
-            logger.debug(f"Added {len(mc_filters)} Media Cloud site filters")
+    news_param = "&tbm=nws" if news_only else ""
+    country_code = _get_country_code(geolocation_country)
+    country_param = f"&gl={country_code}" if country_code else ""
+
+    # Only the start offset varies between pages, so build the fixed URL
+    # parts once
+    url_prefix = f"https://www.google.com/search?q={encoded_query}&start="
+    url_suffix = f"&brd_json=1&num=20{news_param}{country_param}"
+
+    return [
+        {
+            "zone": bright_data_config.zone,
+            "url": f"{url_prefix}{request_num * 20}{url_suffix}",
+            "format": "raw",
+        }
+        for request_num in range(results_pages_per_query)
+    ]
+
+
+async def _retrieve_bright_data_results_async(
+    query: str,
+    results_pages_per_query: int,
+    bright_data_config: BrightDataConfig,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    media_cloud_sources: Optional[List[str]] = None,
+    geolocation_country: Optional[str] = None,
+    news_only: bool = False,
+    session: Optional[aiohttp.ClientSession] = None,
+    num_mc_sites: int = 50,
+) -> List[SerpResult]:
+    """
+    Retrieve search results from Bright Data API for a given query, fetching all result pages concurrently.
+
+    Args:
+        query: Search query string
+        results_pages_per_query: Number of result pages to retrieve
+        bright_data_config: Configuration for Bright Data API
+        start_date: Start date for search filtering (YYYY-MM-DD format)
+        end_date: End date for search filtering (YYYY-MM-DD format)
+        media_cloud_sources: Optional list of Media Cloud source URLs to filter by
+        geolocation_country: Optional country name for geolocation filtering
+        news_only: Whether to retrieve only news results
+        session: Optional aiohttp session to reuse across calls
+        num_mc_sites: Maximum number of Media Cloud sites to include in query
 
-    encoded_query = urllib.parse.quote_plus(query)
+    Returns:
+        List of search results, in page order
+    """
+    payloads = _build_serp_payloads(
+        query,
+        results_pages_per_query,
+        bright_data_config,
+        start_date,
+        end_date,
+        media_cloud_sources,
+        geolocation_country,
+        news_only,
+        num_mc_sites,
+    )
 
     headers = {
         "Content-Type": "application/json",
         "Authorization": f"Bearer {bright_data_config.api_key}",
     }
 
-    if news_only:
-        news_param = "&tbm=nws"
-        logger.debug("Using news only parameter")
-    else:
-        news_param = ""
-
-    # Convert country name to code if provided
-    country_code = None
-    if geolocation_country:
-        with open(os.path.join(DATA_DIR, "country_to_code.json"), "r") as f:
-            country_name_to_code = json.load(f)
-        country_code = country_name_to_code.get(geolocation_country)
-        assert country_code, f"Could not find country code for '{geolocation_country}'"
-        logger.debug(f"Found geolocation country code: {country_code}")
-    country_param = f"&gl={country_code}" if country_code else ""
-
-    all_results = []
-
-    for request_num in range(results_pages_per_query):
-        logger.debug(f"Making request {request_num + 1}/{results_pages_per_query}")
-        # Calculate start parameter for pagination
-        start = request_num * 20
+    async with contextlib.AsyncExitStack() as stack:
+        if session is None:
+            session = await stack.enter_async_context(aiohttp.ClientSession())
 
-        data = {
-            "zone": bright_data_config.zone,
-            "url": f"https://www.google.com/search?q={encoded_query}&start={start}&brd_json=1&num=20{news_param}{country_param}",
-            "format": "raw",
-        }
+        async def fetch(data: Dict[str, str]) -> Dict[str, Any]:
+            async with session.post(
+                bright_data_config.base_url, headers=headers, json=data
+            ) as response:
+                response.raise_for_status()
+                return orjson.loads(await response.read())
 
-        response = requests.post(
-            bright_data_config.base_url, headers=headers, json=data
-        )
-        response.raise_for_status()
-        results = response.json()
-        logger.debug(results)
-        simplified_results = []
-
-        # Get the appropriate results array based on news_only
-        result_items = (
-            results.get("news", []) if news_only else results.get("organic", [])
-        )
+        pages = await asyncio.gather(*(fetch(data) for data in payloads))
 
-        for item in result_items:
-            result = {
-                "link": item.get("link", ""),
-                "title": item.get("title", ""),
-                "description": item.get("description", ""),
-            }
-            # Add source for news results
-            if news_only:
-                result["source"] = item.get("source", "")
-            simplified_results.append(result)
-        logger.debug(
-            f"Retrieved {len(simplified_results)} results from request {request_num + 1}"
-        )
-        all_results.extend(simplified_results)
+    all_results = []
+    for results in pages:
+        all_results.extend(_parse_result_items(results, news_only))
 
     logger.debug(f"Retrieved {len(all_results)} results in total")
     return all_results
@@ -498,29 +1146,31 @@ def _retrieve_bright_data_results(
 def _process_queries_and_stream_results(
     search_queries: List[str],
     variable_value_combinations: List[Optional[Tuple[str, ...]]],
-    date_chunks: List[Dict[str, str]],
+    date_chunks: List[DateChunk],
     results_pages_per_query: int,
     bright_data_config: BrightDataConfig,
     media_cloud_sources: Optional[List[str]],
     geolocation_country: Optional[str],
     news_only: bool,
+    approximate_dedup: bool = False,
     variable_name_with_assigned_countries: Optional[str] = None,
     variable_values_media_cloud_sources: Optional[Dict[str, List[str]]] = None,
     variable_values_geolocation_countries: Optional[Dict[str, str]] = None,
     search_query_variables: Optional[Dict[str, List[str]]] = None,
-) -> Generator[Tuple[Optional[Tuple[str, ...]], str, Dict[str, str]], None, None]:
+) -> Generator[Tuple[Optional[Tuple[str, ...]], str, SerpResult], None, None]:
     """
     Process queries and stream results from all date chunks.
 
     Args:
         search_queries: List of search query strings to process
         variable_value_combinations: List of variable value combinations corresponding to each query
-        date_chunks: List of date range dictionaries with 'start' and 'end' keys
+        date_chunks: List of date chunks to query over
         results_pages_per_query: Number of result pages to retrieve per query
         bright_data_config: Configuration for Bright Data API
         media_cloud_sources: Optional list of Media Cloud source URLs to filter by
         geolocation_country: Optional country code for geolocation filtering
         news_only: Whether to retrieve only news results
+        approximate_dedup: Whether to deduplicate URLs with a bloom filter instead of an exact set
         variable_name_with_assigned_countries: Name of the variable whose values we are assigning countries to
         variable_values_media_cloud_sources: Dictionary mapping variable values to lists of Media Cloud sources
         variable_values_geolocation_countries: Dictionary mapping variable values to geolocation countries
@@ -530,9 +1180,9 @@ def _process_queries_and_stream_results(
         Tuple containing:
             - variable_value_combo: The variable value combination for this query (or None)
             - query: The search query that produced this result
-            - result: Dictionary containing the search result (link, title, description, etc.)
+            - result: The search result (link, title, description, etc.)
     """
-    seen_urls = set()
+    seen_urls = _make_seen_urls(approximate_dedup)
 
     for query, variable_value_combo in zip(search_queries, variable_value_combinations):
         logger.debug(
@@ -591,36 +1241,36 @@ def _process_queries_and_stream_results(
 def _stream_date_chunks(
     query: str,
     variable_value_combo: Optional[Tuple[str, ...]],
-    date_chunks: List[Dict[str, str]],
+    date_chunks: List[DateChunk],
     results_pages_per_query: int,
     bright_data_config: BrightDataConfig,
     media_cloud_sources: Optional[List[str]],
     geolocation_country: Optional[str],
     news_only: bool,
     seen_urls: set,
-) -> Generator[Tuple[Optional[Tuple[str, ...]], str, Dict[str, str]], None, None]:
+) -> Generator[Tuple[Optional[Tuple[str, ...]], str, SerpResult], None, None]:
     """
     Stream results from all date chunks for a single query.
 
     Args:
         query: Search query string to process
         variable_value_combo: Variable value combination for this query (or None)
-        date_chunks: List of date range dictionaries with 'start' and 'end' keys
+        date_chunks: List of date chunks to query over
         results_pages_per_query: Number of result pages to retrieve per query
         bright_data_config: Configuration for Bright Data API
         media_cloud_sources: Optional list of Media Cloud source URLs to filter by
         geolocation_country: Optional country code for geolocation filtering
         news_only: Whether to retrieve only news results
-        seen_urls: Set of URLs already processed to avoid duplicates
+        seen_urls: Set of hashed URLs already processed to avoid duplicates
 
     Yields:
         Tuple containing:
             - variable_value_combo: The variable value combination for this query (or None)
             - query: The search query that produced this result
-            - result: Dictionary containing the search result (link, title, description, etc.)
+            - result: The search result (link, title, description, etc.)
     """
     for chunk in date_chunks:
-        logger.debug(f"Processing date chunk: {chunk['start']} to {chunk['end']}")
+        logger.debug(f"Processing date chunk: {chunk.start} to {chunk.end}")
 
         # Stream results from this date chunk
         yield from _stream_bright_data_results(
@@ -628,8 +1278,8 @@ def _stream_date_chunks(
             variable_value_combo,
             results_pages_per_query,
             bright_data_config,
-            chunk["start"],
-            chunk["end"],
+            chunk.start,
+            chunk.end,
             media_cloud_sources,
             geolocation_country,
             news_only,
@@ -649,7 +1299,7 @@ def _stream_bright_data_results(
     news_only: bool,
     seen_urls: set,
     num_mc_sites: int = 50,
-) -> Generator[Tuple[Optional[Tuple[str, ...]], str, Dict[str, str]], None, None]:
+) -> Generator[Tuple[Optional[Tuple[str, ...]], str, SerpResult], None, None]:
     """
     Stream search results from Bright Data API for a given query.
 
@@ -663,98 +1313,66 @@ def _stream_bright_data_results(
         media_cloud_sources: Optional list of Media Cloud source URLs to filter by
         geolocation_country: Optional country name for geolocation filtering
         news_only: Whether to retrieve only news results
-        seen_urls: Set of URLs already processed to avoid duplicates
+        seen_urls: Set of hashed URLs already processed to avoid duplicates
         num_mc_sites: Maximum number of Media Cloud sites to include in query
 
     Yields:
         Tuple containing:
             - variable_value_combo: The variable value combination for this query (or None)
             - query: The search query that produced this result
-            - result: Dictionary containing the search result (link, title, description, etc.)
+            - result: The search result (link, title, description, etc.)
     """
-    # Build query with date filters
-    date_filters = []
-    if start_date:
-        date_filters.append(f"after:{start_date}")
-    if end_date:
-        date_filters.append(f"before:{end_date}")
-    if date_filters:
-        query = f"{query} {' '.join(date_filters)}"
-        logger.debug(f"Added date filters: {date_filters}")
-
-    # Add Media Cloud collection sites to query if provided
-    if media_cloud_sources:
-        media_cloud_sources = media_cloud_sources[:num_mc_sites]  # truncate sites
-        mc_filters = [f"site:{site}" for site in media_cloud_sources]
-        if mc_filters:
-            query = f"{query} {' OR '.join(mc_filters)}"
-            logger.debug(f"Added {len(mc_filters)} Media Cloud site filters")
-
-    encoded_query = urllib.parse.quote_plus(query)
+    payloads = _build_serp_payloads(
+        query,
+        results_pages_per_query,
+        bright_data_config,
+        start_date,
+        end_date,
+        media_cloud_sources,
+        geolocation_country,
+        news_only,
+        num_mc_sites,
+    )
 
     headers = {
         "Content-Type": "application/json",
         "Authorization": f"Bearer {bright_data_config.api_key}",
     }
 
-    if news_only:
-        news_param = "&tbm=nws"
-        logger.debug("Using news only parameter")
-    else:
-        news_param = ""
-
-    # Convert country name to code if provided
-    country_code = None
-    if geolocation_country:
-        with open(os.path.join(DATA_DIR, "country_to_code.json"), "r") as f:
-            country_name_to_code = json.load(f)
-        country_code = country_name_to_code.get(geolocation_country)
-        assert country_code, f"Could not find country code for '{geolocation_country}'"
-        logger.debug(f"Found geolocation country code: {country_code}")
-    country_param = f"&gl={country_code}" if country_code else ""
-
-    for request_num in range(results_pages_per_query):
-        logger.debug(f"Making request {request_num + 1}/{results_pages_per_query}")
-        # Calculate start parameter for pagination
-        start = request_num * 20
-
-        data = {
-            "zone": bright_data_config.zone,
-            "url": f"https://www.google.com/search?q={encoded_query}&start={start}&brd_json=1&num=20{news_param}{country_param}",
-            "format": "raw",
-        }
-
-        response = requests.post(
-            bright_data_config.base_url, headers=headers, json=data
-        )
-        response.raise_for_status()
-        results = response.json()
-        logger.debug(results)
+    for request_num, data in enumerate(payloads):
+        logger.debug(f"Making request {request_num + 1}/{len(payloads)}")
 
-        # Get the appropriate results array based on news_only
-        result_items = (
-            results.get("news", []) if news_only else results.get("organic", [])
+        simplified_results = _fetch_page_results(
+            data, headers, bright_data_config, news_only
         )
-
-        for item in result_items:
-            result = {
-                "link": item.get("link", ""),
-                "title": item.get("title", ""),
-                "description": item.get("description", ""),
-            }
-            # Add source for news results
-            if news_only:
-                result["source"] = item.get("source", "")
-
+        for result in simplified_results:
             # Only yield if we haven't seen this URL before
-            if result["link"] not in seen_urls:
-                seen_urls.add(result["link"])
+            url_hash = _url_hash(result.link)
+            if url_hash not in seen_urls:
+                seen_urls.add(url_hash)
                 yield (variable_value_combo, query, result)
 
         logger.debug(
-            f"Retrieved and yielded {len(result_items)} results from request {request_num + 1}"
+            f"Retrieved and yielded {len(simplified_results)} results from request {request_num + 1}"
         )
 
+        # A short page means no further pages exist, so skip the
+        # remaining requests
+        if len(simplified_results) < _RESULTS_PER_PAGE:
+            logger.debug("Short page received, stopping pagination early")
+            break
+
+
+class _TemplateMapping(dict):
+    """Mapping for str.format_map that leaves unknown placeholders intact."""
+
+    def __missing__(self, key: str) -> str:
+        return "{" + key + "}"
+
+
+# Candidate variable placeholders in a query template
+_PLACEHOLDER_RE = re.compile(r"\{([A-Za-z_][A-Za-z0-9_]*)\}")
+
 
 def _expand_query_templates(
     templates: List[str],
@@ -776,86 +1394,202 @@ def _expand_query_templates(
     if not variables:
         return templates, [None] * len(templates)
 
-    normalized_variable_names = {
-        k.lower().replace(" ", "_"): v for k, v in variables.items()
-    }
+    # Pipelines often re-expand the same templates and variables across
+    # sibling calls; a hashable signature lets the cached core skip the
+    # Cartesian expansion entirely on repeats
+    expanded_queries, variable_value_combinations = _expand_cached(
+        tuple(templates),
+        tuple(sorted((k, tuple(v)) for k, v in variables.items())),
+    )
+    return list(expanded_queries), list(variable_value_combinations)
+
+
+@lru_cache(maxsize=256)
+def _expand_cached(
+    templates: Tuple[str, ...],
+    variable_items: Tuple[Tuple[str, Tuple[str, ...]], ...],
+) -> Tuple[Tuple[str, ...], Tuple[Optional[Tuple[str, ...]], ...]]:
+    """
+    Expand templates against variable values, caching whole expansions.
+
+    Args:
+        templates: Search query templates containing variable placeholders
+        variable_items: Sorted (name, values) pairs for each variable
+
+    Returns:
+        Tuple containing:
+            - Tuple of expanded query strings with variables replaced
+            - Tuple of variable value combinations for each expanded query
+    """
+    normalized_variable_names = {_norm(k): v for k, v in variable_items}
 
     expanded_queries = []
     variable_value_combinations = []
 
     for template in templates:
-        # Find all variable placeholders in the template
-        placeholders = set()
-        for var_name in normalized_variable_names.keys():
-            if f"{{{var_name}}}" in template.lower():
-                placeholders.add(var_name)
+        # One regex pass finds candidate placeholders instead of scanning
+        # the template once per variable
+        found = {_norm(name) for name in _PLACEHOLDER_RE.findall(template)}
+        var_names = [name for name in normalized_variable_names if name in found]
 
-        if not placeholders:
+        if not var_names:
             # If no placeholders found, use template as is
             expanded_queries.append(template)
             variable_value_combinations.append(None)
             continue
 
-        # Get all possible combinations of values for the found placeholders
-        var_names = list(placeholders)
-        var_values = [normalized_variable_names[name] for name in var_names]
-        combinations = list(itertools.product(*var_values))
+        # Normalize known placeholders once (e.g. {Country} -> {country})
+        # so each combination renders with a single format_map call
+        def normalize_placeholder(match: "re.Match") -> str:
+            name = _norm(match.group(1))
+            return "{" + name + "}" if name in normalized_variable_names else match.group(0)
+
+        normalized_template = _PLACEHOLDER_RE.sub(normalize_placeholder, template)
+
+        # str.format_map rejects literal stray or empty braces (e.g.
+        # "100} off" or "{}"), which the replace-based expansion
+        # tolerated; probe once per template and fall back to
+        # per-placeholder replace when formatting would raise
+        try:
+            normalized_template.format_map(_TemplateMapping())
+            format_safe = True
+        except (ValueError, IndexError, KeyError):
+            format_safe = False
+
+        # Render the template once per value combination; product yields
+        # the combination tuples directly. The combination count is known
+        # up front, so grow both lists once instead of amortized doubling
+        # through per-iteration appends
+        values = [normalized_variable_names[name] for name in var_names]
+        num_combinations = math.prod(len(v) for v in values)
+        index = len(expanded_queries)
+        expanded_queries.extend([None] * num_combinations)
+        variable_value_combinations.extend([None] * num_combinations)
+        for combo in itertools.product(*values):
+            if format_safe:
+                expanded = normalized_template.format_map(
+                    _TemplateMapping(zip(var_names, combo))
+                )
+            else:
+                expanded = normalized_template
+                for name, value in zip(var_names, combo):
+                    expanded = expanded.replace("{" + name + "}", value)
+            expanded_queries[index] = expanded
+            variable_value_combinations[index] = combo
+            index += 1
+    return tuple(expanded_queries), tuple(variable_value_combinations)
+
+
+@lru_cache(maxsize=1024)
+def _parse_ymd(date_string: str) -> datetime:
+    """
+    Parse a YYYY-MM-DD date string, caching repeated parses.
+
+    Runs that chunk many queries over the same date range reparse the
+    identical strings per call; the cache makes repeats a dict lookup.
+
+    Args:
+        date_string: Date in YYYY-MM-DD format
 
-        # Replace placeholders with each combination of values
-        for combo in combinations:
-            query = template
-            for var_name, value in zip(var_names, combo):
-                query = query.replace(f"{{{var_name}}}", value)
-            expanded_queries.append(query)
-            variable_value_combinations.append(tuple(combo))
-    return expanded_queries, variable_value_combinations
+    Returns:
+        datetime: The parsed date
+    """
+    return datetime.strptime(date_string, "%Y-%m-%d")
 
 
-def _get_date_chunks(start_date: str, end_date: str) -> List[Dict[str, str]]:
+def _get_date_chunks(
+    start_date: str, end_date: str, chunk_days: int = 366
+) -> List[DateChunk]:
     """
-    Split date range into chunks of maximum 1 year each, with equal sizes.
+    Split date range into equally sized chunks of at most chunk_days days.
+
+    Bright Data's after:/before: operators already bound the range, so
+    finer chunking only pays off when a single chunk would exceed
+    Google's cap of ~20 pages of results.
 
     Args:
         start_date: Start date in YYYY-MM-DD format
         end_date: End date in YYYY-MM-DD format
+        chunk_days: Maximum number of days per chunk
 
     Returns:
-        List of dictionaries, each containing 'start' and 'end' date keys
+        List of date chunks, each at most chunk_days long
     """
-    start = datetime.strptime(start_date, "%Y-%m-%d")
-    end = datetime.strptime(end_date, "%Y-%m-%d")
+    start = _parse_ymd(start_date)
+    end = _parse_ymd(end_date)
 
     # Calculate total days in range
     total_days = (end - start).days + 1
 
-    # Calculate number of chunks needed (each chunk will be at most 1 year)
-    max_days_per_chunk = 366
-    num_chunks = max(1, (total_days + max_days_per_chunk - 1) // max_days_per_chunk)
+    # Calculate number of chunks needed (each chunk will be at most chunk_days)
+    num_chunks = max(1, (total_days + chunk_days - 1) // chunk_days)
 
-    # Calculate days per chunk (equal size)
-    days_per_chunk = total_days // num_chunks
+    # Build all chunk boundaries in one vectorized pass instead of a
+    # Python loop with per-iteration timedelta arithmetic and strftime
+    edges = pd.date_range(
+        start=start, end=end + timedelta(days=1), periods=num_chunks + 1
+    ).normalize()
+    starts = edges[:-1].strftime("%Y-%m-%d")
+    ends = (edges[1:] - pd.Timedelta(days=1)).strftime("%Y-%m-%d")
 
-    chunks = []
-    current_start = start
+    return [
+        DateChunk(chunk_start, chunk_end)
+        for chunk_start, chunk_end in zip(starts, ends)
+    ]
 
-    for i in range(num_chunks):
-        # For the last chunk, use the actual end date
-        if i == num_chunks - 1:
-            chunk_end = end
-        else:
-            chunk_end = current_start + timedelta(days=days_per_chunk - 1)
 
-        chunks.append(
-            {
-                "start": current_start.strftime("%Y-%m-%d"),
-                "end": chunk_end.strftime("%Y-%m-%d"),
-            }
-        )
+def _load_fast(json_path: str) -> Dict[str, Any]:
+    """
+    Load a JSON data file, preferring a msgpack sidecar when available.
 
-        # Move to next chunk
-        current_start = chunk_end + timedelta(days=1)
+    Binary msgpack loads several times faster than JSON text, so when
+    msgpack is installed a .mp sidecar is written next to the JSON file
+    on first load and reused while it is at least as new as the source.
 
-    return chunks
+    Args:
+        json_path: Path to the JSON file
+
+    Returns:
+        Dict[str, Any]: The parsed file contents
+    """
+    sidecar = json_path + ".mp"
+
+    if msgpack is not None:
+        try:
+            if os.path.getmtime(sidecar) >= os.path.getmtime(json_path):
+                with open(sidecar, "rb") as f:
+                    return msgpack.unpackb(f.read(), raw=False)
+        except OSError:
+            pass
+
+    data = orjson.loads(Path(json_path).read_bytes())
+
+    if msgpack is not None:
+        try:
+            with open(sidecar, "wb") as f:
+                f.write(msgpack.packb(data))
+        except OSError:
+            logger.debug(f"Could not write msgpack sidecar for {json_path}")
+
+    return data
+
+
+@lru_cache(maxsize=None)
+def _load_json(path: str) -> Dict[str, Any]:
+    """
+    Load and cache a JSON data file.
+
+    The bundled data files are read on hot paths (per-query expansion),
+    so each file is parsed once per process. Callers must treat the
+    returned dict as read-only.
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        Dict[str, Any]: The parsed file contents
+    """
+    return _load_fast(path)
 
 
 def get_media_cloud_sources(collection: str) -> List[str]:
@@ -868,17 +1602,12 @@ def get_media_cloud_sources(collection: str) -> List[str]:
     Returns:
         List of Media Cloud source identifiers
     """
-    sources_path = os.path.join(DATA_DIR, "country_to_mc_sources.json")
-
-    with open(sources_path, "r") as f:
-        sources = json.load(f)
-
-    return sources[collection]
+    return _load_json(str(COUNTRY_TO_MC_SOURCES_FILE))[collection]
 
 
 def rerank_results_jina_api(
     queries: List[str], documents: List[str], jina_config: JinaConfig
-) -> List[Dict[str, str]]:
+) -> List[RerankHit]:
     """
     Rerank documents based on their relevance to queries using the Jina API.
 
@@ -887,24 +1616,30 @@ def rerank_results_jina_api(
         documents (List[str]): List of document texts to rerank.
 
     Returns:
-        List[Dict[str, str]]: List of reranked documents with query, text, and score.
-                                Each dict contains:
-                                - "query": The search query
-                                - "text": The document text
-                                - "score": The relevance score
+        List[RerankHit]: Reranked documents, each carrying the search
+            query, the document text and its relevance score.
     """
     if not documents:
         return []
 
-    assert len(queries) == len(
-        documents
-    ), "Queries and documents must have the same length"
+    # An explicit check instead of an assert so the guard survives
+    # python -O instead of letting a misaligned request reach the API
+    if len(queries) != len(documents):
+        raise ValueError("Queries and documents must have the same length")
 
     headers = {
         "Content-Type": "application/json",
         "Authorization": f"Bearer {jina_config.api_key}",
     }
 
+    # Common case: every document shares the same query — rank in a
+    # single call without building the grouping dict
+    first_query = queries[0]
+    if all(query == first_query for query in queries):
+        if len(documents) == 1:
+            return [RerankHit(first_query, documents[0], jina_config.singleton_score)]
+        return _rerank_one(first_query, documents, headers, jina_config)
+
     # Group documents by query
     query_document_groups = {}
     for query, document in zip(queries, documents):
@@ -912,33 +1647,244 @@ def rerank_results_jina_api(
             query_document_groups[query] = []
         query_document_groups[query].append(document)
 
+    # A single-document group ranks trivially, so synthesize its result
+    # locally and save the API round trip
     rerank_results = []
+    multi_document_groups = {}
     for query, documents_for_query in query_document_groups.items():
-        # Rank all documents for this query together
-        data = {
-            "model": jina_config.model,
-            "query": query,
-            "top_n": len(documents_for_query),
-            "documents": documents_for_query,
-            "return_documents": True,
-        }
-        response = requests.post(jina_config.base_url, headers=headers, json=data)
-        response.raise_for_status()
-        ranked_docs = response.json()
-
-        # Add results for this query
-        for ranked_doc in ranked_docs["results"]:
+        if len(documents_for_query) == 1:
             rerank_results.append(
-                {
-                    "query": query,
-                    "text": ranked_doc["document"]["text"],
-                    "score": ranked_doc["relevance_score"],
-                }
+                RerankHit(query, documents_for_query[0], jina_config.singleton_score)
+            )
+        else:
+            multi_document_groups[query] = documents_for_query
+
+    if not multi_document_groups:
+        return rerank_results
+
+    # Coalesce all groups into one round trip when the endpoint supports
+    # multi-query payloads, falling back to per-query calls if it doesn't
+    if jina_config.multi_query and len(multi_document_groups) > 1:
+        try:
+            return rerank_results + _rerank_batch(
+                multi_document_groups, headers, jina_config
+            )
+        except Exception as e:
+            logger.warning(
+                f"Batched rerank failed, falling back to per-query calls: {e}"
             )
 
+    # Each query group is an independent API call, so rank them
+    # concurrently; wall-clock drops to roughly the slowest single call
+    max_workers = min(jina_config.max_workers, len(multi_document_groups))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(
+                _rerank_one, query, documents_for_query, headers, jina_config
+            )
+            for query, documents_for_query in multi_document_groups.items()
+        ]
+
+        failures = 0
+        last_error = None
+        for query, future in zip(multi_document_groups, futures):
+            try:
+                rerank_results.extend(future.result())
+            except Exception as e:
+                # Skip the failed group instead of aborting the batch
+                logger.warning(f"Reranking failed for query '{query}': {e}")
+                failures += 1
+                last_error = e
+
+    # A partial failure degrades gracefully, but when every group failed
+    # the API is down — raise so callers don't mistake it for an empty
+    # but successful rerank
+    if failures == len(multi_document_groups):
+        raise last_error
+
     return rerank_results
 
 
+async def rerank_results_jina_api_stream(
+    queries: List[str], documents: List[str], jina_config: JinaConfig
+) -> AsyncGenerator[RerankHit, None]:
+    """
+    Rerank documents and yield results per query group as they arrive.
+
+    Groups are ranked concurrently over one HTTP/2 connection and each
+    group's results are yielded as soon as its call returns, so
+    downstream processing overlaps with in-flight reranking instead of
+    waiting for the full batch.
+
+    Args:
+        queries (List[str]): List of search queries.
+        documents (List[str]): List of document texts to rerank.
+
+    Yields:
+        RerankHit: Reranked document with query, text, and score
+    """
+    if not documents:
+        return
+
+    # An explicit check instead of an assert so the guard survives
+    # python -O instead of letting a misaligned request reach the API
+    if len(queries) != len(documents):
+        raise ValueError("Queries and documents must have the same length")
+
+    headers = {
+        "Content-Type": "application/json",
+        "Authorization": f"Bearer {jina_config.api_key}",
+    }
+
+    # Group documents by query
+    query_document_groups = {}
+    for query, document in zip(queries, documents):
+        if query not in query_document_groups:
+            query_document_groups[query] = []
+        query_document_groups[query].append(document)
+
+    async with httpx.AsyncClient(http2=True, timeout=60.0) as client:
+
+        async def rank(
+            query: str, documents_for_query: List[str]
+        ) -> Tuple[str, List[str], Dict[str, Any]]:
+            unique_documents = list(dict.fromkeys(documents_for_query))
+            data = {
+                "model": jina_config.model,
+                "query": query,
+                "top_n": len(unique_documents),
+                "documents": unique_documents,
+                "return_documents": True,
+            }
+            response = await client.post(
+                jina_config.base_url, headers=headers, content=orjson.dumps(data)
+            )
+            response.raise_for_status()
+            return query, documents_for_query, orjson.loads(response.content)
+
+        tasks = [
+            asyncio.ensure_future(rank(query, documents_for_query))
+            for query, documents_for_query in query_document_groups.items()
+        ]
+
+        for completed in asyncio.as_completed(tasks):
+            try:
+                query, documents_for_query, ranked_docs = await completed
+            except Exception as e:
+                # Skip the failed group instead of aborting the batch
+                logger.warning(f"Reranking failed for a query group: {e}")
+                continue
+
+            occurrences = Counter(documents_for_query)
+            for ranked_doc in ranked_docs["results"]:
+                text = ranked_doc["document"]["text"]
+                for _ in range(occurrences[text]):
+                    yield RerankHit(query, text, ranked_doc["relevance_score"])
+
+
+def _rerank_batch(
+    query_document_groups: Dict[str, List[str]],
+    headers: Dict[str, str],
+    jina_config: JinaConfig,
+) -> List[RerankHit]:
+    """
+    Rank all query groups in a single multi-query API call.
+
+    Args:
+        query_document_groups: Mapping of query to its documents
+        headers: Request headers including authorization
+        jina_config: Configuration for the Jina API
+
+    Returns:
+        List[RerankHit]: Ranked documents with query, text, and score
+
+    Raises:
+        Exception: If the endpoint rejects the payload or the response
+            does not match the expected grouped shape
+    """
+    pairs = []
+    for query, documents_for_query in query_document_groups.items():
+        unique_documents = list(dict.fromkeys(documents_for_query))
+        pairs.append({"query": query, "documents": unique_documents})
+
+    data = {"model": jina_config.model, "pairs": pairs, "return_documents": True}
+    client = jina_config.client if jina_config.client is not None else _JINA_CLIENT
+    response = client.post(
+        jina_config.base_url, headers=headers, content=orjson.dumps(data)
+    )
+    response.raise_for_status()
+    grouped = orjson.loads(response.content)["results"]
+
+    # zip would silently truncate a mismatched response; raise instead so
+    # the caller falls back to per-query calls
+    if len(grouped) != len(query_document_groups):
+        raise ValueError(
+            f"Batched rerank returned {len(grouped)} groups "
+            f"for {len(query_document_groups)} queries"
+        )
+
+    rerank_results = []
+    for (query, documents_for_query), group in zip(
+        query_document_groups.items(), grouped
+    ):
+        occurrences = Counter(documents_for_query)
+        for ranked_doc in group["results"]:
+            text = ranked_doc["document"]["text"]
+            rerank_results.extend(
+                RerankHit(query, text, ranked_doc["relevance_score"])
+                for _ in range(occurrences[text])
+            )
+    return rerank_results
+
+
+def _rerank_one(
+    query: str,
+    documents_for_query: List[str],
+    headers: Dict[str, str],
+    jina_config: JinaConfig,
+) -> List[RerankHit]:
+    """
+    Rank all documents for a single query via the Jina API.
+
+    Args:
+        query: The search query
+        documents_for_query: Documents to rank against the query
+        headers: Request headers including authorization
+        jina_config: Configuration for the Jina API
+
+    Returns:
+        List[RerankHit]: Ranked documents with query, text, and score
+    """
+    # Jina charges per document, so rank each distinct text once and fan
+    # the score back out to duplicates afterwards
+    unique_documents = list(dict.fromkeys(documents_for_query))
+    occurrences = Counter(documents_for_query)
+
+    data = {
+        "model": jina_config.model,
+        "query": query,
+        "top_n": len(unique_documents),
+        "documents": unique_documents,
+        "return_documents": True,
+    }
+    client = jina_config.client if jina_config.client is not None else _JINA_CLIENT
+    response = client.post(
+        jina_config.base_url, headers=headers, content=orjson.dumps(data)
+    )
+    response.raise_for_status()
+    ranked_docs = orjson.loads(response.content)
+
+    results = []
+    for ranked_doc in ranked_docs["results"]:
+        text = ranked_doc["document"]["text"]
+        # One entry per original occurrence, in ranked order
+        results.extend(
+            RerankHit(query, text, ranked_doc["relevance_score"])
+            for _ in range(occurrences[text])
+        )
+    return results
+
+
 def get_media_cloud_countries() -> List[str]:
     """
     Get list of countries that have Media Cloud collections.
@@ -946,8 +1892,7 @@ def get_media_cloud_countries() -> List[str]:
     Returns:
         List[str]: List of country names that have Media Cloud sources available.
     """
-    with open(os.path.join(DATA_DIR, "country_to_mc_sources.json"), "r") as f:
-        return list(json.load(f).keys())
+    return list(_load_json(str(COUNTRY_TO_MC_SOURCES_FILE)).keys())
 
 
 def get_geolocation_countries() -> List[str]:
@@ -957,8 +1902,7 @@ def get_geolocation_countries() -> List[str]:
     Returns:
         List[str]: List of country names that have geolocation codes available.
     """
-    with open(os.path.join(DATA_DIR, "country_to_code.json"), "r") as f:
-        return list(json.load(f).keys())
+    return list(_load_json(str(COUNTRY_TO_CODE_FILE)).keys())
 
 
 def get_url_date(url: str) -> str:
@@ -983,3 +1927,66 @@ def get_url_date(url: str) -> str:
     except Exception as e:
         logger.warning(f"Error extracting date from {url}: {e}")
         return None
+
+
+async def get_url_dates_async(
+    urls: List[str], max_concurrency: int = 32
+) -> List[Optional[str]]:
+    """
+    Extract publication dates for a batch of URLs concurrently.
+
+    find_date typically fetches the page, so each lookup is a
+    network-bound call; fanning out over worker threads makes a batch
+    complete in roughly the slowest single lookup instead of the sum.
+    The batch gets its own thread pool sized to the fan-out — routing it
+    through the small shared timeout executor would make queued lookups
+    burn their timeout budget waiting for a free thread and spuriously
+    return None.
+
+    Args:
+        urls: The URLs to extract dates from
+        max_concurrency: Maximum number of lookups in flight at once
+
+    Returns:
+        List of extracted date strings (or None per URL), in input order
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    def extract_sync(url: str) -> Optional[str]:
+        try:
+            return find_date(url, extensive_search=True)
+        except Exception as e:
+            logger.warning(f"Error extracting date from {url}: {e}")
+            return None
+
+    executor = ThreadPoolExecutor(max_workers=max_concurrency)
+    try:
+
+        async def extract(url: str) -> Optional[str]:
+            async with semaphore:
+                # The pool always has a free worker per in-flight lookup,
+                # so the timeout clock starts when the lookup starts
+                return await async_timeout(
+                    loop.run_in_executor(executor, extract_sync, url),
+                    timeout=5,
+                    default_value=None,
+                )
+
+        return list(await asyncio.gather(*(extract(url) for url in urls)))
+    finally:
+        executor.shutdown(wait=False)
+
+
+def get_url_dates(urls: List[str], max_concurrency: int = 32) -> List[Optional[str]]:
+    """
+    Extract publication dates for a batch of URLs.
+
+    Args:
+        urls: The URLs to extract dates from
+        max_concurrency: Maximum number of lookups in flight at once
+
+    Returns:
+        List of extracted date strings (or None per URL), in input order
+    """
+    return run_coroutine(get_url_dates_async(urls, max_concurrency))